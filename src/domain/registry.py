@@ -16,6 +16,7 @@ class EntityRegistry:
     """
 
     _registry: dict[EntityType, type[BaseEntity]] = {}
+    _discovered: bool = False
 
     @classmethod
     def register(cls, entity_type: EntityType, entity_class: type[BaseEntity]) -> None:
@@ -38,6 +39,7 @@ class EntityRegistry:
     @classmethod
     def clear(cls) -> None:
         cls._registry.clear()
+        cls._discovered = False
 
     @classmethod
     def auto_discover(cls) -> None:
@@ -47,7 +49,13 @@ class EntityRegistry:
         stubs for types not yet fully implemented. As each layer branch
         replaces a stub with a full implementation, the import moves
         from stubs.py to the dedicated module.
+
+        Idempotent: after the first call this returns immediately until
+        ``clear()`` is called, so hot paths can call it freely.
         """
+        if cls._discovered:
+            return
+
         from domain.entities import (
             DataAsset,
             Department,
@@ -125,3 +133,4 @@ class EntityRegistry:
             Initiative,
         ]:
             cls.register(entity_class.ENTITY_TYPE, entity_class)
+        cls._discovered = True
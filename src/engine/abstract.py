@@ -88,6 +88,13 @@ class AbstractGraphEngine(ABC):
         """Get all relationships for an entity, with optional filters."""
         ...
 
+    @abstractmethod
+    def list_relationships(
+        self, relationship_type: RelationshipType | None = None
+    ) -> list[BaseRelationship]:
+        """List every relationship in the graph, optionally filtered by type."""
+        ...
+
     @abstractmethod
     def relationship_count(self, relationship_type: RelationshipType | None = None) -> int:
         """Count relationships, optionally filtered by type."""
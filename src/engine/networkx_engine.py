@@ -174,6 +174,19 @@ class NetworkXGraphEngine(AbstractGraphEngine):
 
         return results
 
+    def list_relationships(
+        self, relationship_type: RelationshipType | None = None
+    ) -> list[BaseRelationship]:
+        results: list[BaseRelationship] = []
+        rel_type_val = relationship_type.value if relationship_type else None
+        for _, _, data in self._graph.edges(data=True):
+            if rel_type_val and data.get("relationship_type") != rel_type_val:
+                continue
+            rel = self._deserialize_relationship(dict(data))
+            if rel:
+                results.append(rel)
+        return results
+
     def relationship_count(self, relationship_type: RelationshipType | None = None) -> int:
         if relationship_type is None:
             return self._graph.number_of_edges()
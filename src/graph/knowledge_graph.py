@@ -106,6 +106,11 @@ class KnowledgeGraph:
     ) -> list[BaseRelationship]:
         return self._engine.get_relationships(entity_id, direction, relationship_type)
 
+    def list_relationships(
+        self, relationship_type: RelationshipType | None = None
+    ) -> list[BaseRelationship]:
+        return self._engine.list_relationships(relationship_type)
+
     # --- Bulk operations ---
 
     def add_entities_bulk(self, entities: list[BaseEntity]) -> list[str]:
@@ -176,6 +181,10 @@ class KnowledgeGraph:
         relationship: BaseRelationship | None = None,
         before: dict | None = None,
     ) -> None:
+        # With tracking off there is no bus to notify and no log to keep, so
+        # skip building the event (and its model_dump snapshot) entirely.
+        if self._event_bus is None:
+            return
         event = GraphEvent(
             mutation_type=mutation_type,
             entity_type=entity.entity_type.value if entity else None,
@@ -191,5 +200,4 @@ class KnowledgeGraph:
             ),
         )
         self._event_log.append(event)
-        if self._event_bus:
-            self._event_bus.emit(event)
+        self._event_bus.emit(event)
@@ -4,10 +4,10 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from os import PathLike
 
     from domain.base import EntityType
     from ingest.mapping import SchemaMapping
@@ -37,27 +37,44 @@ class MappingLoadResult:
         return self.mapping is not None and len(self.errors) == 0
 
 
-def load_column_mapping(path: Path) -> MappingLoadResult:
+def load_column_mapping(
+    source: str | PathLike[str] | bytes | IO[bytes],
+) -> MappingLoadResult:
     """Load and validate a .mapping.json file.
 
+    ``source`` is normally a path, but raw JSON bytes or a binary file
+    object are accepted too so callers that already hold the content can
+    skip the filesystem. Sources without a string ``name`` (in-memory
+    buffers, files opened from a descriptor) default the mapping name to
+    ``"mapping"``.
+
     Returns a MappingLoadResult with the parsed mapping, warnings, and errors.
     """
-    from pathlib import Path as PathClass
+    from pathlib import Path
 
     from domain.base import EntityType
     from domain.registry import EntityRegistry
 
     result = MappingLoadResult()
-    path = PathClass(path)
 
-    if not path.exists():
-        result.errors.append(f"Mapping file not found: {path}")
-        return result
+    if isinstance(source, (bytes, bytearray)):
+        raw = bytes(source)
+        default_name = "mapping"
+    elif hasattr(source, "read"):
+        raw = source.read()
+        name = getattr(source, "name", None)
+        default_name = Path(name).stem if isinstance(name, str) else "mapping"
+    else:
+        path = Path(source)
+        if not path.exists():
+            result.errors.append(f"Mapping file not found: {path}")
+            return result
+        raw = path.read_bytes()
+        default_name = path.stem
 
     try:
-        with open(path) as f:
-            data = json.load(f)
-    except json.JSONDecodeError as exc:
+        data = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         result.errors.append(f"Invalid JSON in mapping file: {exc}")
         return result
 
@@ -90,8 +107,7 @@ def load_column_mapping(path: Path) -> MappingLoadResult:
 
     # Validate target fields against entity model
     EntityRegistry.auto_discover()
-    entity_class = EntityRegistry.get(entity_type)
-    known_fields = set(entity_class.model_fields.keys())
+    known_fields = EntityRegistry.get(entity_type).model_fields
 
     for source_col, target_field in columns.items():
         if not isinstance(target_field, str):
@@ -110,7 +126,7 @@ def load_column_mapping(path: Path) -> MappingLoadResult:
         return result
 
     result.mapping = ColumnMapping(
-        name=data.get("name", path.stem),
+        name=data.get("name", default_name),
         description=data.get("description", ""),
         entity_type=entity_type,
         name_field=name_field,
@@ -2,11 +2,25 @@
 
 from __future__ import annotations
 
+import functools
+import json
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
+from domain.base import EntityType, RelationshipType
+
 if TYPE_CHECKING:
-    from domain.base import EntityType
+    from domain.base import BaseEntity
+
+# Allowed type strings, built once instead of per validate_json_import call.
+# Entity types map straight to their member so the loop skips Enum.__call__.
+_ENTITY_TYPE_BY_VALUE: dict[str, EntityType] = {e.value: e for e in EntityType}
+_RELATIONSHIP_TYPE_VALUES = frozenset(r.value for r in RelationshipType)
+
+# Entity-specific required fields beyond ``name``, in reporting order
+_REQUIRED_FIELDS: dict[str, tuple[str, ...]] = {
+    EntityType.PERSON.value: ("first_name", "last_name", "email"),
+}
 
 
 @dataclass
@@ -22,16 +36,34 @@ class ValidationResult:
 
     @property
     def is_valid(self) -> bool:
-        return len(self.errors) == 0
+        return not self.errors
+
+    @property
+    def errors_blob(self) -> str:
+        """All errors joined by newlines, for substring checks."""
+        return "\n".join(self.errors)
+
+    @property
+    def warnings_blob(self) -> str:
+        """All warnings joined by newlines, for substring checks."""
+        return "\n".join(self.warnings)
 
 
-def _get_known_fields(entity_type: EntityType) -> set[str]:
-    """Get the set of known field names for an entity type."""
+@functools.cache
+def _model_field_names(entity_class: type[BaseEntity]) -> frozenset[str]:
+    """Field names declared on an entity class (fixed once the class exists)."""
+    return frozenset(entity_class.model_fields)
+
+
+def _get_known_fields(entity_type: EntityType) -> frozenset[str]:
+    """Get the set of known field names for an entity type.
+
+    Callers must run ``EntityRegistry.auto_discover()`` first; doing it
+    here would repeat the discovery for every entity being validated.
+    """
     from domain.registry import EntityRegistry
 
-    EntityRegistry.auto_discover()
-    entity_class = EntityRegistry.get(entity_type)
-    return set(entity_class.model_fields.keys())
+    return _model_field_names(EntityRegistry.get(entity_type))
 
 
 def _check_entity_required_fields(
@@ -45,24 +77,35 @@ def _check_entity_required_fields(
     if not name or (isinstance(name, str) and not name.strip()):
         errors.append(f"Entity {index}: missing or empty 'name'")
 
-    if entity_type_str == "person":
-        for req in ("first_name", "last_name", "email"):
-            if req not in raw or not raw[req]:
-                errors.append(
-                    f"Entity {index} ({raw.get('name', '?')}): missing required field '{req}'"
-                )
+    for req in _REQUIRED_FIELDS.get(entity_type_str, ()):
+        if not raw.get(req):
+            errors.append(
+                f"Entity {index} ({raw.get('name', '?')}): missing required field '{req}'"
+            )
 
 
-def validate_json_import(data: dict[str, Any]) -> ValidationResult:
+def validate_json_import(data: dict[str, Any] | bytes | bytearray) -> ValidationResult:
     """Validate JSON import data before ingestion.
 
     Checks structure, entity types, required fields, unknown fields,
-    relationship validity, and referential integrity.
+    relationship validity, and referential integrity. ``data`` may also be
+    the raw JSON document as bytes, which is decoded here.
     """
-    from domain.base import EntityType, RelationshipType
+    from domain.registry import EntityRegistry
 
+    EntityRegistry.auto_discover()
     result = ValidationResult()
 
+    if isinstance(data, (bytes, bytearray)):
+        try:
+            data = json.loads(data)
+        except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+            result.errors.append(f"Invalid JSON: {exc}")
+            return result
+        if not isinstance(data, dict):
+            result.errors.append("JSON root must be an object with 'entities' key")
+            return result
+
     # --- Structure checks ---
     entities_raw = data.get("entities")
     if entities_raw is None:
@@ -77,28 +120,32 @@ def validate_json_import(data: dict[str, Any]) -> ValidationResult:
         result.errors.append("'relationships' must be a list")
         relationships_raw = []
 
+    # Hot-loop locals: bound once so each row skips the attribute lookups
+    errors = result.errors
+    warnings = result.warnings
+    et_counts = result.entity_type_counts
+    rt_counts = result.relationship_type_counts
+
     # --- Entity validation ---
     entity_ids: set[str] = set()
-    valid_et_values = {e.value for e in EntityType}
 
     for i, raw in enumerate(entities_raw):
         if not isinstance(raw, dict):
-            result.errors.append(f"Entity {i}: must be a dict, got {type(raw).__name__}")
+            errors.append(f"Entity {i}: must be a dict, got {type(raw).__name__}")
             continue
 
         # entity_type check
         et_str = raw.get("entity_type")
         if not et_str:
-            result.errors.append(f"Entity {i}: missing 'entity_type'")
+            errors.append(f"Entity {i}: missing 'entity_type'")
             continue
-        if et_str not in valid_et_values:
-            result.errors.append(
-                f"Entity {i} ({raw.get('name', '?')}): invalid entity_type '{et_str}'"
-            )
+        et = _ENTITY_TYPE_BY_VALUE.get(et_str)
+        if et is None:
+            errors.append(f"Entity {i} ({raw.get('name', '?')}): invalid entity_type '{et_str}'")
             continue
 
         # Required fields
-        _check_entity_required_fields(raw, et_str, i, result.errors)
+        _check_entity_required_fields(raw, et_str, i, errors)
 
         # Track entity ID
         eid = raw.get("id")
@@ -106,59 +153,55 @@ def validate_json_import(data: dict[str, Any]) -> ValidationResult:
             entity_ids.add(eid)
 
         # Count by type
-        result.entity_type_counts[et_str] = result.entity_type_counts.get(et_str, 0) + 1
+        et_counts[et_str] = et_counts.get(et_str, 0) + 1
         result.entity_count += 1
 
         # Unknown field detection
         try:
-            et = EntityType(et_str)
             known = _get_known_fields(et)
-            provided = set(raw.keys())
-            unknown = provided - known
+            unknown = raw.keys() - known
             if unknown:
-                result.warnings.append(
+                warnings.append(
                     f"Entity {i} ({raw.get('name', '?')}): "
                     f"unknown field(s) {sorted(unknown)} "
                     f"(not in {et_str} schema)"
                 )
-        except (ValueError, KeyError):
-            pass  # Already reported as invalid entity_type
+        except KeyError:
+            pass  # Valid type with no registered entity class
 
     # --- Relationship validation ---
-    valid_rt_values = {r.value for r in RelationshipType}
-
     for i, raw in enumerate(relationships_raw):
         if not isinstance(raw, dict):
-            result.errors.append(f"Relationship {i}: must be a dict, got {type(raw).__name__}")
+            errors.append(f"Relationship {i}: must be a dict, got {type(raw).__name__}")
             continue
 
         rt_str = raw.get("relationship_type")
         if not rt_str:
-            result.errors.append(f"Relationship {i}: missing 'relationship_type'")
+            errors.append(f"Relationship {i}: missing 'relationship_type'")
             continue
-        if rt_str not in valid_rt_values:
-            result.errors.append(f"Relationship {i}: invalid relationship_type '{rt_str}'")
+        if rt_str not in _RELATIONSHIP_TYPE_VALUES:
+            errors.append(f"Relationship {i}: invalid relationship_type '{rt_str}'")
             continue
 
         source_id = raw.get("source_id")
         target_id = raw.get("target_id")
         if not source_id:
-            result.errors.append(f"Relationship {i}: missing 'source_id'")
+            errors.append(f"Relationship {i}: missing 'source_id'")
         if not target_id:
-            result.errors.append(f"Relationship {i}: missing 'target_id'")
+            errors.append(f"Relationship {i}: missing 'target_id'")
 
         # Referential integrity (warnings, not errors — merge target may have them)
         if source_id and entity_ids and source_id not in entity_ids:
-            result.warnings.append(
+            warnings.append(
                 f"Relationship {i}: source_id '{source_id}' not found in imported entities"
             )
         if target_id and entity_ids and target_id not in entity_ids:
-            result.warnings.append(
+            warnings.append(
                 f"Relationship {i}: target_id '{target_id}' not found in imported entities"
             )
 
         # Count by type
-        result.relationship_type_counts[rt_str] = result.relationship_type_counts.get(rt_str, 0) + 1
+        rt_counts[rt_str] = rt_counts.get(rt_str, 0) + 1
         result.relationship_count += 1
 
     return result
@@ -179,6 +222,9 @@ def validate_csv_import(
         result.errors.append("CSV has no column headers")
         return result
 
+    from domain.registry import EntityRegistry
+
+    EntityRegistry.auto_discover()
     known = _get_known_fields(entity_type)
     header_set = set(headers)
 
@@ -191,10 +237,11 @@ def validate_csv_import(
         )
 
     # Entity-specific required fields
-    if entity_type.value == "person":
-        for req in ("first_name", "last_name", "email"):
-            if req not in header_set:
-                result.errors.append(f"CSV missing required column '{req}' for person import")
+    for req in _REQUIRED_FIELDS.get(entity_type.value, ()):
+        if req not in header_set:
+            result.errors.append(
+                f"CSV missing required column '{req}' for {entity_type.value} import"
+            )
 
     # Summary
     result.entity_count = 0  # Can't know row count from headers alone
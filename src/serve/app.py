@@ -532,15 +532,19 @@ OPENAI_TOOLS: list[dict] = [
 # ---------------------------------------------------------------------------
 
 
-def create_app(graph_path: str | None = None) -> Any:
+def create_app(graph_path: str | None = None, kg: KnowledgeGraph | None = None) -> Any:
     """Create and configure the Flask application.
 
     Args:
         graph_path: Optional path to a JSON graph file to load on startup.
+        kg: Optional in-memory graph to serve directly, skipping the file
+            load. Takes precedence over ``graph_path``.
 
     Returns:
         A Flask app instance.
     """
+    global _kg  # noqa: PLW0603
+
     try:
         from flask import Flask
         from flask import request as flask_request
@@ -553,7 +557,9 @@ def create_app(graph_path: str | None = None) -> Any:
 
     app = Flask(__name__)
 
-    if graph_path:
+    if kg is not None:
+        _kg = kg
+    elif graph_path:
         with app.app_context():
             result = load_graph_from_path(graph_path)
             if "error" in result:
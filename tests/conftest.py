@@ -6,24 +6,44 @@ from typing import TYPE_CHECKING
 
 import pytest
 
-if TYPE_CHECKING:
-    from pathlib import Path
-
 from domain.base import BaseRelationship, RelationshipType
 from domain.entities.department import Department
 from domain.entities.person import Person
 from domain.entities.system import System
 from domain.registry import EntityRegistry
-from engine.factory import GraphEngineFactory
-from engine.networkx_engine import NetworkXGraphEngine
-from graph.knowledge_graph import KnowledgeGraph
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from engine.networkx_engine import NetworkXGraphEngine
+    from graph.knowledge_graph import KnowledgeGraph
+
+# The engine and graph packages pull in networkx, so they are imported inside
+# the fixtures that need them. Suites that never build a graph (e.g. ingest)
+# can then run without paying that import.
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _prebuild_entity_schemas() -> None:
+    """Resolve every registered entity's core schema once per session.
+
+    ``model_rebuild(force=False)`` is a no-op for models whose schema is
+    already complete, so this only pays for deferred (forward-ref) builds
+    up front instead of inside whichever test first constructs the model.
+    """
+    EntityRegistry.auto_discover()
+    for entity_type in EntityRegistry.all_types():
+        EntityRegistry.get(entity_type).model_rebuild(force=False)
 
 
 @pytest.fixture(autouse=True)
 def _auto_discover() -> None:
-    """Auto-discover entity types and engine backends before each test."""
+    """Auto-discover entity types before each test.
+
+    Engine backends are discovered by ``KnowledgeGraph`` itself on
+    construction, so they are not registered here.
+    """
     EntityRegistry.auto_discover()
-    GraphEngineFactory.auto_discover()
 
 
 @pytest.fixture(autouse=True)
@@ -43,55 +63,66 @@ def _no_claude_sync(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
 @pytest.fixture
 def engine() -> NetworkXGraphEngine:
     """Create a fresh NetworkX engine."""
+    from engine.networkx_engine import NetworkXGraphEngine
+
     return NetworkXGraphEngine()
 
 
 @pytest.fixture
 def kg() -> KnowledgeGraph:
     """Create a fresh KnowledgeGraph."""
+    from graph.knowledge_graph import KnowledgeGraph
+
     return KnowledgeGraph(backend="networkx", track_events=True)
 
 
+# Constructor payloads for the sample entities, shared by the per-test
+# sample_* fixtures and the session-scoped populated_kg
+_SAMPLE_PERSON = {
+    "id": "person-1",
+    "first_name": "Alice",
+    "last_name": "Smith",
+    "name": "Alice Smith",
+    "email": "alice.smith@acme.com",
+    "title": "Software Engineer",
+    "employee_id": "EMP-001",
+    "is_active": True,
+}
+_SAMPLE_DEPARTMENT = {
+    "id": "dept-1",
+    "name": "Engineering",
+    "description": "Engineering department",
+    "code": "ENG",
+    "headcount": 50,
+}
+_SAMPLE_SYSTEM = {
+    "id": "sys-1",
+    "name": "Web Application",
+    "system_type": "application",
+    "hostname": "webapp-001",
+    "ip_address": "10.0.1.100",
+    "os": "Linux",
+    "criticality": "high",
+    "is_internet_facing": True,
+}
+
+
 @pytest.fixture
 def sample_person() -> Person:
     """Create a sample Person entity."""
-    return Person(
-        id="person-1",
-        first_name="Alice",
-        last_name="Smith",
-        name="Alice Smith",
-        email="alice.smith@acme.com",
-        title="Software Engineer",
-        employee_id="EMP-001",
-        is_active=True,
-    )
+    return Person(**_SAMPLE_PERSON)
 
 
 @pytest.fixture
 def sample_department() -> Department:
     """Create a sample Department entity."""
-    return Department(
-        id="dept-1",
-        name="Engineering",
-        description="Engineering department",
-        code="ENG",
-        headcount=50,
-    )
+    return Department(**_SAMPLE_DEPARTMENT)
 
 
 @pytest.fixture
 def sample_system() -> System:
     """Create a sample System entity."""
-    return System(
-        id="sys-1",
-        name="Web Application",
-        system_type="application",
-        hostname="webapp-001",
-        ip_address="10.0.1.100",
-        os="Linux",
-        criticality="high",
-        is_internet_facing=True,
-    )
+    return System(**_SAMPLE_SYSTEM)
 
 
 @pytest.fixture
@@ -105,30 +136,32 @@ def sample_relationship() -> BaseRelationship:
     )
 
 
-@pytest.fixture
-def populated_kg(
-    kg: KnowledgeGraph,
-    sample_person: Person,
-    sample_department: Department,
-    sample_system: System,
-) -> KnowledgeGraph:
-    """Create a KG with sample entities and relationships."""
-    kg.add_entity(sample_person)
-    kg.add_entity(sample_department)
-    kg.add_entity(sample_system)
+@pytest.fixture(scope="session")
+def populated_kg() -> KnowledgeGraph:
+    """Create a KG with the sample entities and relationships, once per session.
+
+    The graph is shared by every test that requests it, so tests must only
+    read from it. Tests that mutate a graph should build one from ``kg``.
+    """
+    from graph.knowledge_graph import KnowledgeGraph
+
+    kg = KnowledgeGraph(backend="networkx", track_events=True)
+    kg.add_entity(Person(**_SAMPLE_PERSON))
+    kg.add_entity(Department(**_SAMPLE_DEPARTMENT))
+    kg.add_entity(System(**_SAMPLE_SYSTEM))
 
     kg.add_relationship(
         BaseRelationship(
             relationship_type=RelationshipType.WORKS_IN,
-            source_id=sample_person.id,
-            target_id=sample_department.id,
+            source_id=_SAMPLE_PERSON["id"],
+            target_id=_SAMPLE_DEPARTMENT["id"],
         )
     )
     kg.add_relationship(
         BaseRelationship(
             relationship_type=RelationshipType.RESPONSIBLE_FOR,
-            source_id=sample_department.id,
-            target_id=sample_system.id,
+            source_id=_SAMPLE_DEPARTMENT["id"],
+            target_id=_SAMPLE_SYSTEM["id"],
         )
     )
 
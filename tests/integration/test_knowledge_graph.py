@@ -77,6 +77,11 @@ class TestKnowledgeGraphLifecycle:
         assert MutationType.UPDATE in types
         assert MutationType.DELETE in types
 
+    def test_event_tracking_disabled(self):
+        kg = KnowledgeGraph(track_events=False)
+        kg.add_entity(Person(id="p1", first_name="A", last_name="B", name="A B", email="a@b.com"))
+        assert kg.event_log == []
+
     def test_event_subscription(self, kg: KnowledgeGraph):
         events_received = []
 
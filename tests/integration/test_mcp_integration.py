@@ -16,13 +16,18 @@ from mcp_server.server import mcp  # noqa: E402
 from synthetic.orchestrator import SyntheticOrchestrator  # noqa: E402
 from synthetic.profiles.tech_company import mid_size_tech_company  # noqa: E402
 
+# FastMCP keeps registered tools in a dict keyed by name; snapshot the
+# callables once so each call is a single lookup
+_TOOLS = {name: tool.fn for name, tool in mcp._tool_manager._tools.items()}
+
 
 def _call_tool(name: str, **kwargs):
     """Call an MCP tool by name via the FastMCP registry."""
-    for tool in mcp._tool_manager._tools.values():
-        if tool.name == name:
-            return tool.fn(**kwargs)
-    raise ValueError(f"Tool '{name}' not found")
+    try:
+        fn = _TOOLS[name]
+    except KeyError:
+        raise ValueError(f"Tool '{name}' not found") from None
+    return fn(**kwargs)
 
 
 def _generate_graph(employees: int = 20, seed: int = 42) -> tuple[KnowledgeGraph, str]:
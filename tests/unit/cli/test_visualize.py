@@ -2,9 +2,6 @@
 
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
-
 import pytest
 from click.testing import CliRunner
 
@@ -18,15 +15,14 @@ from cli.visualize_cmd import (
 )
 
 
-@pytest.fixture()
-def sample_graph_json(populated_kg):
-    """Export the populated_kg fixture to a temp JSON file."""
+@pytest.fixture(scope="session")
+def sample_graph_json(populated_kg, tmp_path_factory):
+    """Export the populated_kg fixture to a temp JSON file once per session."""
     from export.json_export import JSONExporter
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        path = Path(tmpdir) / "test_graph.json"
-        JSONExporter().export(populated_kg.engine, path)
-        yield str(path)
+    path = tmp_path_factory.mktemp("visualize") / "test_graph.json"
+    JSONExporter().export(populated_kg.engine, path)
+    return str(path)
 
 
 class TestNodeLabel:
@@ -82,50 +78,47 @@ class TestEntityMappings:
 
 
 class TestInjectLegend:
-    def test_injects_legend_html(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            html_path = Path(tmpdir) / "test.html"
-            html_path.write_text("<html><body></body></html>")
-            stats = {
-                "entity_count": 10,
-                "relationship_count": 5,
-                "entity_types": {"person": 7, "department": 3},
-            }
-            _inject_legend(html_path, stats)
-            content = html_path.read_text()
-            assert "kg-legend" in content
-            assert "hc-enterprise-kg" in content
-            assert "Person (7)" in content
-            assert "Department (3)" in content
-            assert "10 entities" in content
-
-    def test_missing_body_tag_warns(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            html_path = Path(tmpdir) / "test.html"
-            html_path.write_text("<html><div>no body tag</div></html>")
-            stats = {
-                "entity_count": 5,
-                "relationship_count": 2,
-                "entity_types": {"person": 5},
-            }
-            _inject_legend(html_path, stats)
-            content = html_path.read_text()
-            # Legend should NOT be injected — original content unchanged
-            assert "kg-legend" not in content
-
-    def test_only_shows_present_types(self):
-        with tempfile.TemporaryDirectory() as tmpdir:
-            html_path = Path(tmpdir) / "test.html"
-            html_path.write_text("<html><body></body></html>")
-            stats = {
-                "entity_count": 5,
-                "relationship_count": 2,
-                "entity_types": {"person": 5},
-            }
-            _inject_legend(html_path, stats)
-            content = html_path.read_text()
-            assert "Person (5)" in content
-            assert "Department" not in content
+    def test_injects_legend_html(self, tmp_path):
+        html_path = tmp_path / "test.html"
+        html_path.write_text("<html><body></body></html>")
+        stats = {
+            "entity_count": 10,
+            "relationship_count": 5,
+            "entity_types": {"person": 7, "department": 3},
+        }
+        _inject_legend(html_path, stats)
+        content = html_path.read_text()
+        assert "kg-legend" in content
+        assert "hc-enterprise-kg" in content
+        assert "Person (7)" in content
+        assert "Department (3)" in content
+        assert "10 entities" in content
+
+    def test_missing_body_tag_warns(self, tmp_path):
+        html_path = tmp_path / "test.html"
+        html_path.write_text("<html><div>no body tag</div></html>")
+        stats = {
+            "entity_count": 5,
+            "relationship_count": 2,
+            "entity_types": {"person": 5},
+        }
+        _inject_legend(html_path, stats)
+        content = html_path.read_text()
+        # Legend should NOT be injected — original content unchanged
+        assert "kg-legend" not in content
+
+    def test_only_shows_present_types(self, tmp_path):
+        html_path = tmp_path / "test.html"
+        html_path.write_text("<html><body></body></html>")
+        stats = {
+            "entity_count": 5,
+            "relationship_count": 2,
+            "entity_types": {"person": 5},
+        }
+        _inject_legend(html_path, stats)
+        content = html_path.read_text()
+        assert "Person (5)" in content
+        assert "Department" not in content
 
 
 _pyvis_available = True
@@ -137,38 +130,37 @@ except ImportError:
 
 @pytest.mark.skipif(not _pyvis_available, reason="pyvis not installed")
 class TestVisualizeCLI:
-    def test_visualize_produces_html(self, sample_graph_json):
+    def test_visualize_produces_html(self, sample_graph_json, tmp_path):
         runner = CliRunner()
-        with tempfile.TemporaryDirectory() as tmpdir:
-            out = Path(tmpdir) / "viz.html"
-            result = runner.invoke(
-                cli, ["visualize", sample_graph_json, "--output", str(out), "--no-open"]
-            )
-            assert result.exit_code == 0, result.output
-            assert out.exists()
-            content = out.read_text()
-            assert "<html>" in content.lower()
-            assert "kg-legend" in content
-
-    def test_visualize_default_output_name(self, sample_graph_json):
+        out = tmp_path / "viz.html"
+        result = runner.invoke(
+            cli, ["visualize", sample_graph_json, "--output", str(out), "--no-open"]
+        )
+        assert result.exit_code == 0, result.output
+        assert out.exists()
+        content = out.read_text()
+        assert "<html>" in content.lower()
+        assert "kg-legend" in content
+
+    def test_visualize_default_output_name(self, sample_graph_json, tmp_path, monkeypatch):
+        # The default output lands in the working directory, so run from tmp_path
+        monkeypatch.chdir(tmp_path)
         runner = CliRunner()
         result = runner.invoke(cli, ["visualize", sample_graph_json, "--no-open"])
         assert result.exit_code == 0, result.output
         # Default name is <stem>_viz.html
-        expected = Path("test_graph_viz.html")
-        assert expected.exists() or "Visualization saved" in result.output
+        assert (tmp_path / "test_graph_viz.html").exists()
 
-    def test_visualize_no_physics(self, sample_graph_json):
+    def test_visualize_no_physics(self, sample_graph_json, tmp_path):
         runner = CliRunner()
-        with tempfile.TemporaryDirectory() as tmpdir:
-            out = Path(tmpdir) / "viz.html"
-            result = runner.invoke(
-                cli,
-                ["visualize", sample_graph_json, "--output", str(out), "--no-open", "--no-physics"],
-            )
-            assert result.exit_code == 0, result.output
-            content = out.read_text()
-            assert "<html>" in content.lower()
+        out = tmp_path / "viz.html"
+        result = runner.invoke(
+            cli,
+            ["visualize", sample_graph_json, "--output", str(out), "--no-open", "--no-physics"],
+        )
+        assert result.exit_code == 0, result.output
+        content = out.read_text()
+        assert "<html>" in content.lower()
 
     def test_visualize_malformed_json(self, tmp_path):
         bad = tmp_path / "bad.json"
@@ -192,14 +184,13 @@ class TestVisualizeCLI:
         result = runner.invoke(cli, ["visualize", "/tmp/nonexistent_xyz.json", "--no-open"])
         assert result.exit_code != 0
 
-    def test_visualize_contains_entity_data(self, sample_graph_json):
+    def test_visualize_contains_entity_data(self, sample_graph_json, tmp_path):
         runner = CliRunner()
-        with tempfile.TemporaryDirectory() as tmpdir:
-            out = Path(tmpdir) / "viz.html"
-            result = runner.invoke(
-                cli, ["visualize", sample_graph_json, "--output", str(out), "--no-open"]
-            )
-            assert result.exit_code == 0, result.output
-            content = out.read_text()
-            # Should contain node data from our fixtures
-            assert "Alice Smith" in content or "Engineering" in content
+        out = tmp_path / "viz.html"
+        result = runner.invoke(
+            cli, ["visualize", sample_graph_json, "--output", str(out), "--no-open"]
+        )
+        assert result.exit_code == 0, result.output
+        content = out.read_text()
+        # Should contain node data from our fixtures
+        assert "Alice Smith" in content or "Engineering" in content
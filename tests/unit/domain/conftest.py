@@ -0,0 +1,111 @@
+"""Shared fixtures for domain model tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from domain.entities.integration import (
+    CrossesBoundary,
+    DataExchanged,
+    ErrorHandling,
+    IntegrationAvailabilitySLA,
+    IntegrationCost,
+    IntegrationSecurityProfile,
+    LatencyRequirement,
+    MiddlewarePlatform,
+    SystemRef,
+)
+
+
+@pytest.fixture
+def sap_system_ref() -> SystemRef:
+    """SAP S/4HANA source system reference."""
+    return SystemRef(system_id="SY-00142", system_name="SAP S/4HANA")
+
+
+@pytest.fixture
+def snowflake_system_ref() -> SystemRef:
+    """Snowflake target system reference."""
+    return SystemRef(system_id="SY-00200", system_name="Snowflake")
+
+
+@pytest.fixture
+def mulesoft_platform() -> MiddlewarePlatform:
+    """MuleSoft middleware platform."""
+    return MiddlewarePlatform(
+        platform_name="MuleSoft Anypoint",
+        platform_system_id="SY-00050",
+        managed_by="Integration Team",
+    )
+
+
+@pytest.fixture
+def gl_data_exchanged() -> DataExchanged:
+    """Confidential finance GL journal feed."""
+    return DataExchanged(
+        data_description="Financial GL journal entries",
+        data_classification="Confidential",
+        data_domains=["Finance", "Accounting"],
+        volume_per_day="2.5 GB",
+        record_count_per_day=500_000,
+    )
+
+
+@pytest.fixture
+def batch_latency_requirement() -> LatencyRequirement:
+    """Five-minute batch latency target that is being met."""
+    return LatencyRequirement(
+        max_acceptable_ms=300_000,
+        actual_p95_ms=180_000,
+        meets_requirement=True,
+    )
+
+
+@pytest.fixture
+def backoff_error_handling() -> ErrorHandling:
+    """Exponential backoff with a dead-letter queue."""
+    return ErrorHandling(
+        retry_mechanism="Exponential Backoff",
+        dead_letter_queue=True,
+        alerting=True,
+        error_rate_pct=0.02,
+    )
+
+
+@pytest.fixture
+def three_nines_sla() -> IntegrationAvailabilitySLA:
+    """99.9% availability target."""
+    return IntegrationAvailabilitySLA(target_uptime_pct=99.9, actual_uptime_pct=99.95)
+
+
+@pytest.fixture
+def oauth_security_profile() -> IntegrationSecurityProfile:
+    """OAuth 2.0 over TLS 1.3 with rate limiting."""
+    return IntegrationSecurityProfile(
+        authentication="OAuth 2.0",
+        encryption_in_transit=True,
+        encryption_protocol="TLS 1.3",
+        rate_limiting=True,
+    )
+
+
+@pytest.fixture
+def eu_us_boundary() -> CrossesBoundary:
+    """Cloud/on-prem EU-to-US transfer under SCCs."""
+    return CrossesBoundary(
+        crosses_network_boundary=True,
+        boundary_type="Cloud/On-Prem",
+        crosses_jurisdiction=True,
+        source_jurisdiction="EU",
+        target_jurisdiction="US",
+        cross_border_transfer_mechanism="SCCs",
+    )
+
+
+@pytest.fixture
+def mulesoft_integration_cost() -> IntegrationCost:
+    """Annual MuleSoft run cost."""
+    return IntegrationCost(
+        amount=85_000,
+        cost_components=["MuleSoft license", "CloudHub workers"],
+    )
@@ -26,3 +26,30 @@ class TestEntityRegistry:
             pass
         # Re-register for other tests
         EntityRegistry.auto_discover()
+
+    def test_auto_discover_is_idempotent(self):
+        EntityRegistry.auto_discover()
+        before = dict(EntityRegistry._registry)
+        EntityRegistry.auto_discover()
+        assert EntityRegistry._registry == before
+
+    def test_clear_rearms_discovery(self):
+        EntityRegistry.clear()
+        assert not EntityRegistry.is_registered(EntityType.PERSON)
+        EntityRegistry.auto_discover()
+        assert EntityRegistry.get(EntityType.PERSON) is Person
+        assert len(EntityRegistry.all_types()) == 30
+
+    def test_custom_registration_survives_auto_discover(self):
+        class CustomPerson(Person):
+            pass
+
+        EntityRegistry.auto_discover()
+        EntityRegistry.register(EntityType.PERSON, CustomPerson)
+        try:
+            EntityRegistry.auto_discover()
+            assert EntityRegistry.get(EntityType.PERSON) is CustomPerson
+        finally:
+            # Rebuild the built-in registry for other tests
+            EntityRegistry.clear()
+            EntityRegistry.auto_discover()
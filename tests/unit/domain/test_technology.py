@@ -4,20 +4,13 @@ Covers System (extended) and Integration (new) entities.
 Tests construction, sub-model instantiation, and JSON serialization roundtrip.
 """
 
+import pytest
 from pydantic import TypeAdapter
 
 from domain.base import EntityType
 from domain.entities import AnyEntity
 from domain.entities.integration import (
-    CrossesBoundary,
-    DataExchanged,
-    ErrorHandling,
     Integration,
-    IntegrationAvailabilitySLA,
-    IntegrationCost,
-    IntegrationSecurityProfile,
-    LatencyRequirement,
-    MiddlewarePlatform,
     SystemRef,
 )
 from domain.entities.system import (
@@ -55,6 +48,12 @@ from domain.entities.system import (
 
 _any_entity_adapter = TypeAdapter(AnyEntity)
 
+_INTEGRATION_DISCRIMINATOR_JSON = (
+    b'{"entity_type": "integration", "name": "SCADA to Historian",'
+    b' "integration_id": "IN-00020", "integration_type": "OPC-UA",'
+    b' "direction": "Unidirectional"}'
+)
+
 
 # ===========================================================================
 # System tests (extended)
@@ -332,8 +331,8 @@ class TestSystemExtended:
             encryption_profile=EncryptionProfile(data_at_rest="AES-256"),
             total_cost_of_ownership=TotalCostOfOwnership(annual_tco=100_000),
         )
-        data = s.model_dump()
-        s2 = System.model_validate(data)
+        raw = s.model_dump_json()
+        s2 = System.model_validate_json(raw)
         assert s2.system_id == "SY-99999"
         assert s2.hostname == "test01"
         assert s2.technology_stack[0].technology == "Linux"
@@ -359,75 +358,63 @@ class TestSystemExtended:
 # ===========================================================================
 
 
+@pytest.fixture(scope="module")
+def empty_integration() -> Integration:
+    """A minimally constructed Integration shared by the default checks."""
+    return Integration(name="_")
+
+
 class TestIntegration:
-    def test_minimal_construction(self):
-        i = Integration(name="SAP-to-Warehouse")
-        assert i.entity_type == EntityType.INTEGRATION
-        assert i.integration_id == ""
-        assert i.source_systems == []
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("entity_type", EntityType.INTEGRATION),
+            ("integration_id", ""),
+            ("source_systems", []),
+            ("crosses_boundary.crosses_network_boundary", False),
+            ("crosses_boundary.crosses_jurisdiction", False),
+            ("security_profile.encryption_in_transit", False),
+        ],
+    )
+    def test_integration_defaults(self, empty_integration, path, expected):
+        obj = empty_integration
+        for attr in path.split("."):
+            obj = getattr(obj, attr)
+        assert obj == expected
 
-    def test_full_construction(self):
+    def test_full_construction(
+        self,
+        sap_system_ref,
+        snowflake_system_ref,
+        mulesoft_platform,
+        gl_data_exchanged,
+        batch_latency_requirement,
+        backoff_error_handling,
+        three_nines_sla,
+        oauth_security_profile,
+        eu_us_boundary,
+        mulesoft_integration_cost,
+    ):
         i = Integration(
             name="SAP S/4HANA → Snowflake Data Warehouse",
             integration_id="IN-00001",
             integration_type="API",
             integration_pattern="Batch",
-            source_systems=[
-                SystemRef(system_id="SY-00142", system_name="SAP S/4HANA"),
-            ],
-            target_systems=[
-                SystemRef(system_id="SY-00200", system_name="Snowflake"),
-            ],
+            source_systems=[sap_system_ref],
+            target_systems=[snowflake_system_ref],
             direction="Unidirectional",
-            middleware_platform=MiddlewarePlatform(
-                platform_name="MuleSoft Anypoint",
-                platform_system_id="SY-00050",
-                managed_by="Integration Team",
-            ),
-            data_exchanged=DataExchanged(
-                data_description="Financial GL journal entries",
-                data_classification="Confidential",
-                data_domains=["Finance", "Accounting"],
-                volume_per_day="2.5 GB",
-                record_count_per_day=500_000,
-            ),
+            middleware_platform=mulesoft_platform,
+            data_exchanged=gl_data_exchanged,
             frequency="Daily",
-            latency_requirement=LatencyRequirement(
-                max_acceptable_ms=300_000,
-                actual_p95_ms=180_000,
-                meets_requirement=True,
-            ),
-            error_handling=ErrorHandling(
-                retry_mechanism="Exponential Backoff",
-                dead_letter_queue=True,
-                alerting=True,
-                error_rate_pct=0.02,
-            ),
-            availability_sla=IntegrationAvailabilitySLA(
-                target_uptime_pct=99.9,
-                actual_uptime_pct=99.95,
-            ),
+            latency_requirement=batch_latency_requirement,
+            error_handling=backoff_error_handling,
+            availability_sla=three_nines_sla,
             operational_status="Active",
-            security_profile=IntegrationSecurityProfile(
-                authentication="OAuth 2.0",
-                encryption_in_transit=True,
-                encryption_protocol="TLS 1.3",
-                rate_limiting=True,
-            ),
-            crosses_boundary=CrossesBoundary(
-                crosses_network_boundary=True,
-                boundary_type="Cloud/On-Prem",
-                crosses_jurisdiction=True,
-                source_jurisdiction="EU",
-                target_jurisdiction="US",
-                cross_border_transfer_mechanism="SCCs",
-            ),
+            security_profile=oauth_security_profile,
+            crosses_boundary=eu_us_boundary,
             owner="Integration Architect",
             integration_support_team="Enterprise Integration Team",
-            annual_cost=IntegrationCost(
-                amount=85_000,
-                cost_components=["MuleSoft license", "CloudHub workers"],
-            ),
+            annual_cost=mulesoft_integration_cost,
             monitoring_status="Fully Monitored",
             effective_date="2023-06-15",
         )
@@ -450,26 +437,13 @@ class TestIntegration:
             source_systems=[SystemRef(system_id="SY-001", system_name="Salesforce")],
             target_systems=[SystemRef(system_id="SY-002", system_name="Marketo")],
         )
-        data = i.model_dump()
-        i2 = Integration.model_validate(data)
+        raw = i.model_dump_json()
+        i2 = Integration.model_validate_json(raw)
         assert i2.integration_id == "IN-00010"
         assert i2.integration_pattern == "Pub-Sub"
         assert i2.source_systems[0].system_name == "Salesforce"
 
     def test_any_entity_roundtrip(self):
-        data = {
-            "entity_type": "integration",
-            "name": "SCADA to Historian",
-            "integration_id": "IN-00020",
-            "integration_type": "OPC-UA",
-            "direction": "Unidirectional",
-        }
-        entity = _any_entity_adapter.validate_python(data)
+        entity = _any_entity_adapter.validate_json(_INTEGRATION_DISCRIMINATOR_JSON)
         assert isinstance(entity, Integration)
         assert entity.integration_type == "OPC-UA"
-
-    def test_boundary_crossing_defaults(self):
-        i = Integration(name="Internal sync")
-        assert i.crosses_boundary.crosses_network_boundary is False
-        assert i.crosses_boundary.crosses_jurisdiction is False
-        assert i.security_profile.encryption_in_transit is False
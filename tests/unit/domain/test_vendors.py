@@ -4,22 +4,14 @@ Covers extended Vendor entity and new Contract entity with attribute group
 coverage, sub-model instantiation, and JSON serialization roundtrip.
 """
 
+from typing import Any
+
+import pytest
 from pydantic import TypeAdapter
 
 from domain.base import EntityType
 from domain.entities import AnyEntity
-from domain.entities.contract import (
-    Amendment,
-    AssociatedContract,
-    Contract,
-    DataHandlingProvisions,
-    EarlyTerminationPenalty,
-    GoverningLaw,
-    InsuranceRequirements,
-    IPProvisions,
-    LiabilityCaps,
-    SLAEntry,
-)
+from domain.entities.contract import Contract
 from domain.entities.vendor import (
     BusinessContinuity,
     CoInvestment,
@@ -387,15 +379,14 @@ class TestVendorExtended:
             vendor_type="Preferred Vendor",
             strategic_importance="High",
         )
-        data = v.model_dump(mode="json")
-        restored = Vendor.model_validate(data)
+        raw = v.model_dump_json()
+        restored = Vendor.model_validate_json(raw)
         assert restored.vendor_id == "VN-99999"
         assert restored.strategic_importance == "High"
 
     def test_any_entity_roundtrip(self):
         v = Vendor(name="AnyEntity Test", vendor_id="VN-AE-001")
-        data = v.model_dump(mode="json")
-        restored = _any_entity_adapter.validate_python(data)
+        restored = _any_entity_adapter.validate_json(v.model_dump_json())
         assert isinstance(restored, Vendor)
         assert restored.vendor_id == "VN-AE-001"
 
@@ -405,168 +396,227 @@ class TestVendorExtended:
 # ===========================================================================
 
 
-class TestContract:
-    def test_minimal_construction(self):
-        c = Contract(name="Cloud Services MSA")
-        assert c.entity_type == EntityType.CONTRACT
-        assert c.name == "Cloud Services MSA"
-        assert c.contract_id == ""
-
-    def test_identity_and_parties(self):
-        c = Contract(
-            name="Enterprise SaaS Agreement",
-            contract_id="CT-00001",
-            contract_type="SaaS Subscription",
-            contract_status="Active",
-            vendor_id="VN-TECHCORP",
-            contract_owner="RL-BIZ-OWNER",
-            legal_owner="RL-LEGAL-001",
-            procurement_owner="RL-PROC-001",
-            contracting_org_unit="OU-IT",
-        )
-        assert c.contract_id == "CT-00001"
-        assert c.contract_type == "SaaS Subscription"
-        assert c.vendor_id == "VN-TECHCORP"
-
-    def test_financial_terms(self):
-        c = Contract(
-            name="Supply Agreement",
-            total_contract_value=15_000_000,
-            annual_value=5_000_000,
-            currency="USD",
-            payment_schedule="Quarterly",
-            payment_terms="Net 30",
-        )
-        assert c.total_contract_value == 15_000_000
-        assert c.annual_value == 5_000_000
-        assert c.payment_schedule == "Quarterly"
-
-    def test_duration_renewal(self):
-        c = Contract(
-            name="Multi-Year MSA",
-            start_date="2022-01-01",
-            end_date="2025-12-31",
-            initial_term="36 months",
-            current_term="Year 3 of 3",
-            auto_renewal=True,
-            renewal_term="12 months",
-            notice_period_days=90,
-            opt_out_deadline="2025-09-30",
-            renewal_cap_pct=5.0,
-        )
-        assert c.auto_renewal is True
-        assert c.notice_period_days == 90
-        assert c.renewal_cap_pct == 5.0
-
-    def test_termination(self):
-        c = Contract(
-            name="Consulting SOW",
-            termination_for_convenience=True,
-            termination_notice_days=30,
-            early_termination_penalty=EarlyTerminationPenalty(
-                penalty_exists=True,
-                penalty_description="50% of remaining contract value",
-                penalty_amount=2_500_000,
-            ),
-        )
-        assert c.termination_for_convenience is True
-        assert c.early_termination_penalty.penalty_amount == 2_500_000
-
-    def test_slas(self):
-        c = Contract(
-            name="Managed Services",
-            sla_summary=[
-                SLAEntry(
-                    sla_name="Uptime",
-                    metric="Availability",
-                    target="99.95%",
-                    measurement_method="Monthly rolling",
-                    penalty_for_breach="5% credit per 0.1% below target",
-                ),
-                SLAEntry(
-                    sla_name="Response Time",
-                    metric="P1 response",
-                    target="< 15 minutes",
-                ),
+def _resolve(obj: Any, path: str) -> Any:
+    """Walk a dotted attribute path; numeric segments index into lists."""
+    for part in path.split("."):
+        obj = obj[int(part)] if part.isdigit() else getattr(obj, part)
+    return obj
+
+
+# (constructor kwargs, [(dotted path, expected value)], {dotted path: expected len})
+_CONTRACT_CASES = [
+    pytest.param(
+        {"name": "Cloud Services MSA"},
+        [
+            ("entity_type", EntityType.CONTRACT),
+            ("name", "Cloud Services MSA"),
+            ("contract_id", ""),
+        ],
+        {},
+        id="minimal_construction",
+    ),
+    pytest.param(
+        {
+            "name": "Enterprise SaaS Agreement",
+            "contract_id": "CT-00001",
+            "contract_type": "SaaS Subscription",
+            "contract_status": "Active",
+            "vendor_id": "VN-TECHCORP",
+            "contract_owner": "RL-BIZ-OWNER",
+            "legal_owner": "RL-LEGAL-001",
+            "procurement_owner": "RL-PROC-001",
+            "contracting_org_unit": "OU-IT",
+        },
+        [
+            ("contract_id", "CT-00001"),
+            ("contract_type", "SaaS Subscription"),
+            ("vendor_id", "VN-TECHCORP"),
+        ],
+        {},
+        id="identity_and_parties",
+    ),
+    pytest.param(
+        {
+            "name": "Supply Agreement",
+            "total_contract_value": 15_000_000,
+            "annual_value": 5_000_000,
+            "currency": "USD",
+            "payment_schedule": "Quarterly",
+            "payment_terms": "Net 30",
+        },
+        [
+            ("total_contract_value", 15_000_000),
+            ("annual_value", 5_000_000),
+            ("payment_schedule", "Quarterly"),
+        ],
+        {},
+        id="financial_terms",
+    ),
+    pytest.param(
+        {
+            "name": "Multi-Year MSA",
+            "start_date": "2022-01-01",
+            "end_date": "2025-12-31",
+            "initial_term": "36 months",
+            "current_term": "Year 3 of 3",
+            "auto_renewal": True,
+            "renewal_term": "12 months",
+            "notice_period_days": 90,
+            "opt_out_deadline": "2025-09-30",
+            "renewal_cap_pct": 5.0,
+        },
+        [
+            ("auto_renewal", True),
+            ("notice_period_days", 90),
+            ("renewal_cap_pct", 5.0),
+        ],
+        {},
+        id="duration_renewal",
+    ),
+    pytest.param(
+        {
+            "name": "Consulting SOW",
+            "termination_for_convenience": True,
+            "termination_notice_days": 30,
+            "early_termination_penalty": {
+                "penalty_exists": True,
+                "penalty_description": "50% of remaining contract value",
+                "penalty_amount": 2_500_000,
+            },
+        },
+        [
+            ("termination_for_convenience", True),
+            ("early_termination_penalty.penalty_amount", 2_500_000),
+        ],
+        {},
+        id="termination",
+    ),
+    pytest.param(
+        {
+            "name": "Managed Services",
+            "sla_summary": [
+                {
+                    "sla_name": "Uptime",
+                    "metric": "Availability",
+                    "target": "99.95%",
+                    "measurement_method": "Monthly rolling",
+                    "penalty_for_breach": "5% credit per 0.1% below target",
+                },
+                {
+                    "sla_name": "Response Time",
+                    "metric": "P1 response",
+                    "target": "< 15 minutes",
+                },
             ],
-        )
-        assert len(c.sla_summary) == 2
-        assert c.sla_summary[0].target == "99.95%"
-
-    def test_key_provisions(self):
-        c = Contract(
-            name="Data Processing Agreement",
-            data_handling_provisions=DataHandlingProvisions(
-                data_classification=["Confidential", "PII"],
-                data_return_clause=True,
-                data_destruction_clause=True,
-                breach_notification_hours=72,
-                sub_processor_approval_required=True,
-            ),
-            insurance_requirements=InsuranceRequirements(
-                cyber_insurance_required=True,
-                minimum_coverage=10_000_000,
-                verified=True,
-            ),
-            liability_caps=LiabilityCaps(
-                liability_cap=50_000_000,
-                liability_type="Direct Damages Only",
-                unlimited_liability_carve_outs=[
+        },
+        [
+            ("sla_summary.0.target", "99.95%"),
+            ("sla_summary.1.sla_name", "Response Time"),
+        ],
+        {"sla_summary": 2},
+        id="slas",
+    ),
+    pytest.param(
+        {
+            "name": "Data Processing Agreement",
+            "data_handling_provisions": {
+                "data_classification": ["Confidential", "PII"],
+                "data_return_clause": True,
+                "data_destruction_clause": True,
+                "breach_notification_hours": 72,
+                "sub_processor_approval_required": True,
+            },
+            "insurance_requirements": {
+                "cyber_insurance_required": True,
+                "minimum_coverage": 10_000_000,
+                "verified": True,
+            },
+            "liability_caps": {
+                "liability_cap": 50_000_000,
+                "liability_type": "Direct Damages Only",
+                "unlimited_liability_carve_outs": [
                     "Data breach",
                     "IP infringement",
                     "Confidentiality",
                 ],
-            ),
-            ip_provisions=IPProvisions(
-                ip_ownership="Vendor Retains",
-                work_product_ownership="Enterprise Owns",
-            ),
-            governing_law=GoverningLaw(
-                jurisdiction="State of Delaware, USA",
-                dispute_resolution_mechanism="Arbitration",
-            ),
-        )
-        assert c.data_handling_provisions.breach_notification_hours == 72
-        assert c.insurance_requirements.minimum_coverage == 10_000_000
-        assert len(c.liability_caps.unlimited_liability_carve_outs) == 3
-        assert c.governing_law.dispute_resolution_mechanism == "Arbitration"
-
-    def test_amendments_related(self):
-        c = Contract(
-            name="Amended MSA",
-            amendments=[
-                Amendment(
-                    amendment_id="AMD-001",
-                    amendment_date="2024-06-01",
-                    description="Added cloud migration services",
-                    financial_impact=500_000,
-                )
+            },
+            "ip_provisions": {
+                "ip_ownership": "Vendor Retains",
+                "work_product_ownership": "Enterprise Owns",
+            },
+            "governing_law": {
+                "jurisdiction": "State of Delaware, USA",
+                "dispute_resolution_mechanism": "Arbitration",
+            },
+        },
+        [
+            ("data_handling_provisions.breach_notification_hours", 72),
+            ("insurance_requirements.minimum_coverage", 10_000_000),
+            (
+                "liability_caps.unlimited_liability_carve_outs",
+                ["Data breach", "IP infringement", "Confidentiality"],
+            ),
+            ("governing_law.dispute_resolution_mechanism", "Arbitration"),
+        ],
+        {"liability_caps.unlimited_liability_carve_outs": 3},
+        id="key_provisions",
+    ),
+    pytest.param(
+        {
+            "name": "Amended MSA",
+            "amendments": [
+                {
+                    "amendment_id": "AMD-001",
+                    "amendment_date": "2024-06-01",
+                    "description": "Added cloud migration services",
+                    "financial_impact": 500_000,
+                }
             ],
-            associated_contracts=[
-                AssociatedContract(
-                    contract_id="CT-NDA-001",
-                    relationship="Related NDA",
-                ),
-                AssociatedContract(
-                    contract_id="CT-DPA-001",
-                    relationship="Related DPA",
-                ),
+            "associated_contracts": [
+                {
+                    "contract_id": "CT-NDA-001",
+                    "relationship": "Related NDA",
+                },
+                {
+                    "contract_id": "CT-DPA-001",
+                    "relationship": "Related DPA",
+                },
             ],
-        )
-        assert len(c.amendments) == 1
-        assert c.amendments[0].financial_impact == 500_000
-        assert len(c.associated_contracts) == 2
+        },
+        [
+            ("amendments.0.financial_impact", 500_000),
+            ("associated_contracts.0.contract_id", "CT-NDA-001"),
+            ("associated_contracts.1.contract_id", "CT-DPA-001"),
+        ],
+        {"amendments": 1, "associated_contracts": 2},
+        id="amendments_related",
+    ),
+    pytest.param(
+        {
+            "name": "Platform License",
+            "with_vendor": "VN-PLATFORM",
+            "covers_systems": ["SYS-ERP", "SYS-CRM"],
+            "covers_data": ["DA-CUSTOMER", "DA-ORDERS"],
+            "covers_products": ["PR-PLATFORM"],
+        },
+        [
+            ("with_vendor", "VN-PLATFORM"),
+            ("covers_systems", ["SYS-ERP", "SYS-CRM"]),
+        ],
+        {"covers_systems": 2},
+        id="relationships",
+    ),
+]
 
-    def test_relationships(self):
-        c = Contract(
-            name="Platform License",
-            with_vendor="VN-PLATFORM",
-            covers_systems=["SYS-ERP", "SYS-CRM"],
-            covers_data=["DA-CUSTOMER", "DA-ORDERS"],
-            covers_products=["PR-PLATFORM"],
-        )
-        assert c.with_vendor == "VN-PLATFORM"
-        assert len(c.covers_systems) == 2
+
+class TestContract:
+    @pytest.mark.parametrize(("kwargs", "checks", "lengths"), _CONTRACT_CASES)
+    def test_contract_attribute_groups(self, kwargs, checks, lengths):
+        c = Contract(**kwargs)
+        for path, expected in checks:
+            assert _resolve(c, path) == expected, path
+        for path, expected_len in lengths.items():
+            assert len(_resolve(c, path)) == expected_len, path
 
     def test_json_roundtrip(self):
         c = Contract(
@@ -575,13 +625,12 @@ class TestContract:
             contract_type="Master Services Agreement",
             contract_status="Active",
         )
-        data = c.model_dump(mode="json")
-        restored = Contract.model_validate(data)
+        raw = c.model_dump_json()
+        restored = Contract.model_validate_json(raw)
         assert restored.contract_id == "CT-99999"
 
     def test_any_entity_roundtrip(self):
         c = Contract(name="AnyEntity Test", contract_id="CT-AE-001")
-        data = c.model_dump(mode="json")
-        restored = _any_entity_adapter.validate_python(data)
+        restored = _any_entity_adapter.validate_json(c.model_dump_json())
         assert isinstance(restored, Contract)
         assert restored.contract_id == "CT-AE-001"
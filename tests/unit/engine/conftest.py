@@ -0,0 +1,27 @@
+"""Shared fixtures for engine tests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from engine.networkx_engine import NetworkXGraphEngine
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from engine.abstract import AbstractGraphEngine
+
+
+@pytest.fixture(scope="module")
+def engine() -> NetworkXGraphEngine:
+    """One NetworkX engine per test module, cleared after every test."""
+    return NetworkXGraphEngine()
+
+
+@pytest.fixture(autouse=True)
+def _clear_engine(engine: AbstractGraphEngine) -> Iterator[None]:
+    """Reset the shared engine so each test starts from an empty graph."""
+    yield
+    engine.clear()
@@ -2,23 +2,47 @@
 
 import pytest
 
-from domain.base import BaseRelationship, EntityType, RelationshipType
+from domain.base import BaseEntity, BaseRelationship, EntityType, RelationshipType
 from domain.entities.department import Department
 from domain.entities.person import Person
 from domain.entities.system import System
 from engine.abstract import AbstractGraphEngine
-from engine.networkx_engine import NetworkXGraphEngine
+
+# Constructor payloads shared by most contract tests
+_P1 = {"id": "p1", "first_name": "A", "last_name": "B", "name": "A B", "email": "a@b.com"}
+_D1 = {"id": "d1", "name": "Eng"}
+
+# (id, first_name, last_name, name, email) rows for test_bulk_add
+_BULK_PEOPLE = tuple((f"p{i}", f"F{i}", f"L{i}", f"F{i} L{i}", f"p{i}@test.com") for i in range(10))
+
+
+def _rel(
+    rtype: RelationshipType = RelationshipType.WORKS_IN,
+    src: str = "p1",
+    tgt: str = "d1",
+    rid: str | None = None,
+) -> BaseRelationship:
+    """Build a relationship, defaulting to p1 -works_in-> d1."""
+    kwargs = {"relationship_type": rtype, "source_id": src, "target_id": tgt}
+    if rid is not None:
+        kwargs["id"] = rid
+    return BaseRelationship(**kwargs)
 
 
 class GraphEngineContractTests:
-    """Contract tests that any AbstractGraphEngine implementation must pass."""
+    """Contract tests that any AbstractGraphEngine implementation must pass.
+
+    The ``engine`` fixture comes from ``tests/unit/engine/conftest.py``; a
+    subclass for another backend overrides it with its own engine.
+    """
 
-    @pytest.fixture
-    def engine(self) -> AbstractGraphEngine:
-        raise NotImplementedError
+    @staticmethod
+    def _add(engine: AbstractGraphEngine, *entities: BaseEntity) -> list[str]:
+        """Add several entities through the engine's bulk path."""
+        return engine.add_entities_bulk(list(entities))
 
     def test_add_and_get_entity(self, engine):
-        person = Person(id="p1", first_name="A", last_name="B", name="A B", email="a@b.com")
+        person = Person(**_P1)
         eid = engine.add_entity(person)
         assert eid == "p1"
 
@@ -30,14 +54,14 @@ class GraphEngineContractTests:
         assert engine.get_entity("nonexistent") is None
 
     def test_update_entity(self, engine):
-        person = Person(id="p1", first_name="A", last_name="B", name="A B", email="a@b.com")
+        person = Person(**_P1)
         engine.add_entity(person)
 
         updated = engine.update_entity("p1", {"title": "Senior Engineer"})
         assert updated is not None
 
     def test_remove_entity(self, engine):
-        person = Person(id="p1", first_name="A", last_name="B", name="A B", email="a@b.com")
+        person = Person(**_P1)
         engine.add_entity(person)
 
         assert engine.remove_entity("p1") is True
@@ -47,10 +71,7 @@ class GraphEngineContractTests:
         assert engine.remove_entity("nonexistent") is False
 
     def test_list_entities(self, engine):
-        engine.add_entity(
-            Person(id="p1", first_name="A", last_name="B", name="A B", email="a@b.com")
-        )
-        engine.add_entity(Department(id="d1", name="Eng"))
+        self._add(engine, Person(**_P1), Department(**_D1))
 
         all_entities = engine.list_entities()
         assert len(all_entities) == 2
@@ -60,140 +81,93 @@ class GraphEngineContractTests:
 
     def test_entity_count(self, engine):
         assert engine.entity_count() == 0
-        engine.add_entity(
-            Person(id="p1", first_name="A", last_name="B", name="A B", email="a@b.com")
-        )
+        engine.add_entity(Person(**_P1))
         assert engine.entity_count() == 1
         assert engine.entity_count(EntityType.PERSON) == 1
         assert engine.entity_count(EntityType.SYSTEM) == 0
 
     def test_add_relationship(self, engine):
-        engine.add_entity(
-            Person(id="p1", first_name="A", last_name="B", name="A B", email="a@b.com")
-        )
-        engine.add_entity(Department(id="d1", name="Eng"))
+        self._add(engine, Person(**_P1), Department(**_D1))
 
-        rel = BaseRelationship(
-            id="r1",
-            relationship_type=RelationshipType.WORKS_IN,
-            source_id="p1",
-            target_id="d1",
-        )
+        rel = _rel(rid="r1")
         rid = engine.add_relationship(rel)
         assert rid == "r1"
 
     def test_add_relationship_missing_source(self, engine):
-        engine.add_entity(Department(id="d1", name="Eng"))
-        rel = BaseRelationship(
-            relationship_type=RelationshipType.WORKS_IN, source_id="nonexistent", target_id="d1"
-        )
+        engine.add_entity(Department(**_D1))
+        rel = _rel(src="nonexistent")
         with pytest.raises(KeyError):
             engine.add_relationship(rel)
 
     def test_get_relationship(self, engine):
-        engine.add_entity(
-            Person(id="p1", first_name="A", last_name="B", name="A B", email="a@b.com")
-        )
-        engine.add_entity(Department(id="d1", name="Eng"))
-        engine.add_relationship(
-            BaseRelationship(
-                id="r1", relationship_type=RelationshipType.WORKS_IN, source_id="p1", target_id="d1"
-            )
-        )
+        self._add(engine, Person(**_P1), Department(**_D1))
+        engine.add_relationship(_rel(rid="r1"))
 
         rel = engine.get_relationship("r1")
         assert rel is not None
         assert rel.source_id == "p1"
 
     def test_remove_relationship(self, engine):
-        engine.add_entity(
-            Person(id="p1", first_name="A", last_name="B", name="A B", email="a@b.com")
-        )
-        engine.add_entity(Department(id="d1", name="Eng"))
-        engine.add_relationship(
-            BaseRelationship(
-                id="r1", relationship_type=RelationshipType.WORKS_IN, source_id="p1", target_id="d1"
-            )
-        )
+        self._add(engine, Person(**_P1), Department(**_D1))
+        engine.add_relationship(_rel(rid="r1"))
 
         assert engine.remove_relationship("r1") is True
         assert engine.get_relationship("r1") is None
 
-    def test_neighbors(self, engine):
-        engine.add_entity(
-            Person(id="p1", first_name="A", last_name="B", name="A B", email="a@b.com")
-        )
-        engine.add_entity(Department(id="d1", name="Eng"))
+    def test_list_relationships(self, engine):
+        self._add(engine, Person(**_P1), Department(**_D1), System(id="s1", name="Web App"))
+        engine.add_relationship(_rel(rid="r1"))
         engine.add_relationship(
-            BaseRelationship(
-                relationship_type=RelationshipType.WORKS_IN, source_id="p1", target_id="d1"
-            )
+            _rel(RelationshipType.RESPONSIBLE_FOR, src="d1", tgt="s1", rid="r2")
         )
 
+        assert {r.id for r in engine.list_relationships()} == {"r1", "r2"}
+        responsible = engine.list_relationships(RelationshipType.RESPONSIBLE_FOR)
+        assert [r.id for r in responsible] == ["r2"]
+
+    def test_neighbors(self, engine):
+        self._add(engine, Person(**_P1), Department(**_D1))
+        engine.add_relationship(_rel())
+
         neighbors = engine.neighbors("p1", direction="out")
         assert len(neighbors) == 1
         assert neighbors[0].id == "d1"
 
     def test_shortest_path(self, engine):
-        engine.add_entity(
-            Person(id="p1", first_name="A", last_name="B", name="A B", email="a@b.com")
-        )
-        engine.add_entity(Department(id="d1", name="Eng"))
-        engine.add_entity(System(id="s1", name="Web App"))
-        engine.add_relationship(
-            BaseRelationship(
-                relationship_type=RelationshipType.WORKS_IN, source_id="p1", target_id="d1"
-            )
-        )
-        engine.add_relationship(
-            BaseRelationship(
-                relationship_type=RelationshipType.RESPONSIBLE_FOR, source_id="d1", target_id="s1"
-            )
-        )
+        self._add(engine, Person(**_P1), Department(**_D1), System(id="s1", name="Web App"))
+        engine.add_relationship(_rel())
+        engine.add_relationship(_rel(RelationshipType.RESPONSIBLE_FOR, src="d1", tgt="s1"))
 
         path = engine.shortest_path("p1", "s1")
         assert path == ["p1", "d1", "s1"]
 
     def test_shortest_path_no_path(self, engine):
-        engine.add_entity(
-            Person(id="p1", first_name="A", last_name="B", name="A B", email="a@b.com")
-        )
-        engine.add_entity(System(id="s1", name="Web App"))
+        self._add(engine, Person(**_P1), System(id="s1", name="Web App"))
         assert engine.shortest_path("p1", "s1") is None
 
     def test_bulk_add(self, engine):
         people = [
-            Person(
-                id=f"p{i}",
-                first_name=f"F{i}",
-                last_name=f"L{i}",
-                name=f"F{i} L{i}",
-                email=f"p{i}@test.com",
-            )
-            for i in range(10)
+            Person(id=pid, first_name=first, last_name=last, name=name, email=email)
+            for pid, first, last, name, email in _BULK_PEOPLE
         ]
         ids = engine.add_entities_bulk(people)
         assert len(ids) == 10
         assert engine.entity_count() == 10
 
     def test_statistics(self, engine):
-        engine.add_entity(
-            Person(id="p1", first_name="A", last_name="B", name="A B", email="a@b.com")
-        )
+        engine.add_entity(Person(**_P1))
         stats = engine.get_statistics()
         assert stats["entity_count"] == 1
         assert stats["relationship_count"] == 0
 
     def test_clear(self, engine):
-        engine.add_entity(
-            Person(id="p1", first_name="A", last_name="B", name="A B", email="a@b.com")
-        )
+        engine.add_entity(Person(**_P1))
         engine.clear()
         assert engine.entity_count() == 0
 
     def test_update_entity_rollback_on_invalid(self, engine):
         """Invalid updates should raise ValueError and leave original data intact."""
-        person = Person(id="p1", first_name="A", last_name="B", name="A B", email="a@b.com")
+        person = Person(**_P1)
         engine.add_entity(person)
 
         # Setting entity_type to an invalid value should fail validation
@@ -207,22 +181,11 @@ class GraphEngineContractTests:
         assert retrieved.entity_type == EntityType.PERSON
 
     def test_remove_entity_removes_relationships(self, engine):
-        engine.add_entity(
-            Person(id="p1", first_name="A", last_name="B", name="A B", email="a@b.com")
-        )
-        engine.add_entity(Department(id="d1", name="Eng"))
-        engine.add_relationship(
-            BaseRelationship(
-                id="r1", relationship_type=RelationshipType.WORKS_IN, source_id="p1", target_id="d1"
-            )
-        )
+        self._add(engine, Person(**_P1), Department(**_D1))
+        engine.add_relationship(_rel(rid="r1"))
         engine.remove_entity("p1")
         assert engine.relationship_count() == 0
 
 
 class TestNetworkXEngine(GraphEngineContractTests):
     """Runs the full engine contract test suite against NetworkX backend."""
-
-    @pytest.fixture
-    def engine(self) -> AbstractGraphEngine:
-        return NetworkXGraphEngine()
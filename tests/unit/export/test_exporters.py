@@ -1,8 +1,11 @@
 """Tests for JSON and GraphML exporters."""
 
+from __future__ import annotations
+
 import json
-import tempfile
-from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
 
 from domain.base import BaseRelationship, RelationshipType
 from domain.entities.department import Department
@@ -11,8 +14,13 @@ from engine.networkx_engine import NetworkXGraphEngine
 from export.graphml_export import GraphMLExporter
 from export.json_export import JSONExporter
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 
-def _build_engine() -> NetworkXGraphEngine:
+@pytest.fixture(scope="module")
+def built_engine() -> NetworkXGraphEngine:
+    """Two-entity, one-relationship graph shared read-only by every exporter test."""
     engine = NetworkXGraphEngine()
     person = Person(
         id="p1",
@@ -35,10 +43,9 @@ def _build_engine() -> NetworkXGraphEngine:
 
 
 class TestJSONExporter:
-    def test_export_string_returns_valid_json(self):
-        engine = _build_engine()
+    def test_export_string_returns_valid_json(self, built_engine):
         exporter = JSONExporter()
-        result = exporter.export_string(engine)
+        result = exporter.export_string(built_engine)
         data = json.loads(result)
         assert "entities" in data
         assert "relationships" in data
@@ -46,61 +53,55 @@ class TestJSONExporter:
         assert len(data["entities"]) == 2
         assert len(data["relationships"]) == 1
 
-    def test_export_to_file(self):
-        engine = _build_engine()
+    def test_export_to_file(self, built_engine, tmp_path: Path):
         exporter = JSONExporter()
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "output.json"
-            exporter.export(engine, path)
-            assert path.exists()
-            data = json.loads(path.read_text())
-            assert len(data["entities"]) == 2
-
-    def test_export_statistics_include_counts(self):
-        engine = _build_engine()
+        path = tmp_path / "output.json"
+        exporter.export(built_engine, path)
+        assert path.exists()
+        data = json.loads(path.read_text())
+        assert len(data["entities"]) == 2
+
+    def test_export_statistics_include_counts(self, built_engine):
         exporter = JSONExporter()
-        result = exporter.export_string(engine)
+        result = exporter.export_string(built_engine)
         data = json.loads(result)
         stats = data["statistics"]
         assert stats["entity_count"] == 2
         assert stats["relationship_count"] == 1
 
-    def test_export_with_custom_indent(self):
-        engine = _build_engine()
+    def test_export_with_custom_indent(self, built_engine):
         exporter = JSONExporter()
-        result = exporter.export_string(engine, indent=4)
-        # 4-space indent means lines start with 4 spaces
-        assert "    " in result
+        result = exporter.export_string(built_engine, indent=4)
+        # 4-space indent means the first nested line starts with 4 spaces
+        lines = result.splitlines()
+        assert len(lines) > 1
+        assert lines[1].startswith("    ")
+        assert not lines[1].startswith("     ")
 
 
 class TestGraphMLExporter:
-    def test_export_string_returns_xml(self):
-        engine = _build_engine()
+    def test_export_string_returns_xml(self, built_engine):
         exporter = GraphMLExporter()
-        result = exporter.export_string(engine)
+        result = exporter.export_string(built_engine)
         assert "<?xml" in result or "<graphml" in result
 
-    def test_export_to_file(self):
-        engine = _build_engine()
+    def test_export_to_file(self, built_engine, tmp_path: Path):
         exporter = GraphMLExporter()
-        with tempfile.TemporaryDirectory() as tmpdir:
-            path = Path(tmpdir) / "output.graphml"
-            exporter.export(engine, path)
-            assert path.exists()
-            content = path.read_text()
-            assert "graphml" in content
-
-    def test_export_contains_nodes_and_edges(self):
-        engine = _build_engine()
+        path = tmp_path / "output.graphml"
+        exporter.export(built_engine, path)
+        assert path.exists()
+        content = path.read_text()
+        assert "graphml" in content
+
+    def test_export_contains_nodes_and_edges(self, built_engine):
         exporter = GraphMLExporter()
-        result = exporter.export_string(engine)
+        result = exporter.export_string(built_engine)
         assert "p1" in result
         assert "d1" in result
         assert "<edge" in result
 
-    def test_complex_attributes_converted_to_strings(self):
-        engine = _build_engine()
+    def test_complex_attributes_converted_to_strings(self, built_engine):
         exporter = GraphMLExporter()
         # Should not raise even with complex attrs
-        result = exporter.export_string(engine)
+        result = exporter.export_string(built_engine)
         assert isinstance(result, str)
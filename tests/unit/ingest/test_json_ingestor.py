@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import re
 from typing import TYPE_CHECKING
 
 from ingest.json_ingestor import JSONIngestor
@@ -10,20 +11,24 @@ from ingest.json_ingestor import JSONIngestor
 if TYPE_CHECKING:
     from pathlib import Path
 
+# Two departments, serialized once and shared by the file and string ingest tests
+_SAMPLE_JSON = json.dumps(
+    {
+        "entities": [
+            {"entity_type": "department", "id": "d1", "name": "Engineering"},
+            {"entity_type": "department", "id": "d2", "name": "Marketing"},
+        ],
+        "relationships": [],
+    }
+)
+
 
 class TestJSONIngestorFile:
     """Tests for file-based JSON ingestion."""
 
     def test_ingest_file(self, tmp_path: Path):
-        data = {
-            "entities": [
-                {"entity_type": "department", "name": "Engineering"},
-                {"entity_type": "department", "name": "Marketing"},
-            ],
-            "relationships": [],
-        }
         p = tmp_path / "test.json"
-        p.write_text(json.dumps(data))
+        p.write_text(_SAMPLE_JSON)
 
         ingestor = JSONIngestor()
         result = ingestor.ingest(p)
@@ -34,7 +39,7 @@ class TestJSONIngestorFile:
         ingestor = JSONIngestor()
         result = ingestor.ingest("/tmp/nonexistent_test_hckg.json")
         assert len(result.errors) == 1
-        assert "not found" in result.errors[0].lower()
+        assert re.search(r"(?i)not found", result.errors[0])
 
     def test_ingest_invalid_json_file(self, tmp_path: Path):
         p = tmp_path / "bad.json"
@@ -43,7 +48,7 @@ class TestJSONIngestorFile:
         ingestor = JSONIngestor()
         result = ingestor.ingest(p)
         assert len(result.errors) == 1
-        assert "invalid json" in result.errors[0].lower()
+        assert re.search(r"(?i)invalid json", result.errors[0])
 
     def test_can_handle(self):
         ingestor = JSONIngestor()
@@ -55,15 +60,9 @@ class TestJSONIngestString:
     """Tests for ingest_string() method."""
 
     def test_ingest_string_basic(self):
-        data = {
-            "entities": [
-                {"entity_type": "department", "name": "Engineering"},
-            ],
-            "relationships": [],
-        }
         ingestor = JSONIngestor()
-        result = ingestor.ingest_string(json.dumps(data))
-        assert len(result.entities) == 1
+        result = ingestor.ingest_string(_SAMPLE_JSON)
+        assert len(result.entities) == 2
         assert result.entities[0].name == "Engineering"
         assert not result.errors
 
@@ -98,7 +97,7 @@ class TestJSONIngestString:
         ingestor = JSONIngestor()
         result = ingestor.ingest_string("not json {{{")
         assert len(result.errors) == 1
-        assert "invalid json" in result.errors[0].lower()
+        assert re.search(r"(?i)invalid json", result.errors[0])
 
     def test_ingest_string_empty(self):
         ingestor = JSONIngestor()
@@ -108,21 +107,12 @@ class TestJSONIngestString:
 
     def test_ingest_string_matches_file_ingest(self, tmp_path: Path):
         """ingest_string() should produce same result as ingest() for same data."""
-        data = {
-            "entities": [
-                {"entity_type": "department", "id": "d1", "name": "Eng"},
-                {"entity_type": "department", "id": "d2", "name": "Mkt"},
-            ],
-            "relationships": [],
-        }
-        json_str = json.dumps(data)
-
         p = tmp_path / "test.json"
-        p.write_text(json_str)
+        p.write_text(_SAMPLE_JSON)
 
         ingestor = JSONIngestor()
         file_result = ingestor.ingest(p)
-        str_result = ingestor.ingest_string(json_str)
+        str_result = ingestor.ingest_string(_SAMPLE_JSON)
 
         assert len(file_result.entities) == len(str_result.entities)
         assert len(file_result.errors) == len(str_result.errors)
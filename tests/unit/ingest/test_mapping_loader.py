@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import io
 import json
-from typing import TYPE_CHECKING
+import os
+import re
+from typing import TYPE_CHECKING, Any
+
+import pytest
 
 from domain.base import EntityType
 from ingest.mapping_loader import (
@@ -13,17 +20,18 @@ from ingest.mapping_loader import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
+    from ingest.mapping import SchemaMapping
+
 
-def _write_mapping(tmp_path: Path, data: dict) -> Path:
-    """Write a mapping dict to a temp JSON file."""
-    path = tmp_path / "test.mapping.json"
-    path.write_text(json.dumps(data))
-    return path
+def _encode(data: dict[str, Any]) -> bytes:
+    """Serialize a mapping dict for in-memory loading."""
+    return json.dumps(data).encode()
 
 
-VALID_MAPPING = {
+_VALID_MAPPING: dict[str, Any] = {
     "name": "Test Mapping",
     "description": "Maps test columns",
     "entity_type": "person",
@@ -37,9 +45,44 @@ VALID_MAPPING = {
 }
 
 
+@pytest.fixture
+def valid_mapping() -> dict[str, Any]:
+    """Deep copy of the valid mapping, free for each test to mutate."""
+    return copy.deepcopy(_VALID_MAPPING)
+
+
+@pytest.fixture(scope="session")
+def mapping_file_factory(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[[dict[str, Any]], Path]:
+    """Return a writer that stores each distinct mapping payload only once.
+
+    Files land in a per-payload directory as ``test.mapping.json`` so the
+    filename-derived default name stays stable.
+    """
+    root = tmp_path_factory.mktemp("mappings")
+    written: dict[bytes, Path] = {}
+
+    def write(data: dict[str, Any]) -> Path:
+        payload = _encode(data)
+        key = hashlib.blake2b(payload, digest_size=8).digest()
+        path = written.get(key)
+        if path is None:
+            directory = root / key.hex()
+            directory.mkdir()
+            path = directory / "test.mapping.json"
+            path.write_bytes(payload)
+            written[key] = path
+        return path
+
+    return write
+
+
 class TestLoadColumnMapping:
-    def test_valid_mapping(self, tmp_path: Path) -> None:
-        path = _write_mapping(tmp_path, VALID_MAPPING)
+    def test_valid_mapping(
+        self, mapping_file_factory: Callable[[dict[str, Any]], Path], valid_mapping: dict[str, Any]
+    ) -> None:
+        path = mapping_file_factory(valid_mapping)
         result = load_column_mapping(path)
         assert result.is_valid
         assert result.mapping is not None
@@ -54,89 +97,96 @@ class TestLoadColumnMapping:
         assert not result.is_valid
         assert "not found" in result.errors[0]
 
-    def test_invalid_json(self, tmp_path: Path) -> None:
-        path = tmp_path / "bad.json"
-        path.write_text("not json {{{")
-        result = load_column_mapping(path)
+    def test_invalid_json(self) -> None:
+        result = load_column_mapping(b"not json {{{")
         assert not result.is_valid
         assert "Invalid JSON" in result.errors[0]
 
-    def test_not_a_dict(self, tmp_path: Path) -> None:
-        path = tmp_path / "array.json"
-        path.write_text("[1, 2, 3]")
-        result = load_column_mapping(path)
+    @pytest.mark.parametrize("wrap", [bytes, io.BytesIO], ids=["bytes", "file_object"])
+    def test_invalid_utf8(self, wrap: Callable[[bytes], Any]) -> None:
+        result = load_column_mapping(wrap(b"\x80abc"))
+        assert not result.is_valid
+        assert "Invalid JSON" in result.errors[0]
+
+    def test_not_a_dict(self) -> None:
+        result = load_column_mapping(b"[1, 2, 3]")
         assert not result.is_valid
         assert "JSON object" in result.errors[0]
 
-    def test_missing_entity_type(self, tmp_path: Path) -> None:
-        data = {**VALID_MAPPING}
-        del data["entity_type"]
-        path = _write_mapping(tmp_path, data)
-        result = load_column_mapping(path)
+    def test_missing_entity_type(self, valid_mapping: dict[str, Any]) -> None:
+        del valid_mapping["entity_type"]
+        result = load_column_mapping(_encode(valid_mapping))
         assert not result.is_valid
         assert "entity_type" in result.errors[0]
 
-    def test_invalid_entity_type(self, tmp_path: Path) -> None:
-        data = {**VALID_MAPPING, "entity_type": "bogus"}
-        path = _write_mapping(tmp_path, data)
-        result = load_column_mapping(path)
+    def test_invalid_entity_type(self, valid_mapping: dict[str, Any]) -> None:
+        valid_mapping["entity_type"] = "bogus"
+        result = load_column_mapping(_encode(valid_mapping))
         assert not result.is_valid
         assert "bogus" in result.errors[0]
 
-    def test_missing_name_field(self, tmp_path: Path) -> None:
-        data = {**VALID_MAPPING}
-        del data["name_field"]
-        path = _write_mapping(tmp_path, data)
-        result = load_column_mapping(path)
+    def test_missing_name_field(self, valid_mapping: dict[str, Any]) -> None:
+        del valid_mapping["name_field"]
+        result = load_column_mapping(_encode(valid_mapping))
         assert not result.is_valid
         assert "name_field" in result.errors[0]
 
-    def test_columns_not_a_dict(self, tmp_path: Path) -> None:
-        data = {**VALID_MAPPING, "columns": ["not", "a", "dict"]}
-        path = _write_mapping(tmp_path, data)
-        result = load_column_mapping(path)
+    def test_columns_not_a_dict(self, valid_mapping: dict[str, Any]) -> None:
+        valid_mapping["columns"] = ["not", "a", "dict"]
+        result = load_column_mapping(_encode(valid_mapping))
         assert not result.is_valid
         assert "dict" in result.errors[0]
 
-    def test_empty_columns_ok(self, tmp_path: Path) -> None:
-        data = {**VALID_MAPPING, "columns": {}}
-        path = _write_mapping(tmp_path, data)
-        result = load_column_mapping(path)
+    def test_empty_columns_ok(self, valid_mapping: dict[str, Any]) -> None:
+        valid_mapping["columns"] = {}
+        result = load_column_mapping(_encode(valid_mapping))
         assert result.is_valid
         assert result.mapping is not None
         assert len(result.mapping.columns) == 0
 
-    def test_default_name_from_filename(self, tmp_path: Path) -> None:
-        data = {**VALID_MAPPING}
-        del data["name"]
-        path = _write_mapping(tmp_path, data)
+    def test_default_name_from_filename(
+        self, mapping_file_factory: Callable[[dict[str, Any]], Path], valid_mapping: dict[str, Any]
+    ) -> None:
+        del valid_mapping["name"]
+        path = mapping_file_factory(valid_mapping)
         result = load_column_mapping(path)
         assert result.is_valid
         assert result.mapping is not None
         assert result.mapping.name == "test.mapping"
 
+    def test_file_object(self, valid_mapping: dict[str, Any]) -> None:
+        del valid_mapping["name"]
+        result = load_column_mapping(io.BytesIO(_encode(valid_mapping)))
+        assert result.is_valid
+        assert result.mapping is not None
+        assert result.mapping.name == "mapping"
+        assert len(result.mapping.columns) == 4
+
+    def test_file_object_from_descriptor(
+        self, mapping_file_factory: Callable[[dict[str, Any]], Path], valid_mapping: dict[str, Any]
+    ) -> None:
+        del valid_mapping["name"]
+        fd = os.open(mapping_file_factory(valid_mapping), os.O_RDONLY)
+        with open(fd, "rb") as f:  # f.name is the int descriptor
+            result = load_column_mapping(f)
+        assert result.is_valid
+        assert result.mapping is not None
+        assert result.mapping.name == "mapping"
+
 
 class TestColumnValidation:
-    def test_unknown_target_field_warns(self, tmp_path: Path) -> None:
-        data = {
-            **VALID_MAPPING,
-            "columns": {"Source_Col": "totally_bogus_field"},
-        }
-        path = _write_mapping(tmp_path, data)
-        result = load_column_mapping(path)
+    def test_unknown_target_field_warns(self, valid_mapping: dict[str, Any]) -> None:
+        valid_mapping["columns"] = {"Source_Col": "totally_bogus_field"}
+        result = load_column_mapping(_encode(valid_mapping))
         assert result.is_valid  # warnings, not errors
         assert len(result.warnings) == 1
         assert "totally_bogus_field" in result.warnings[0]
 
-    def test_non_string_target_value_errors(self, tmp_path: Path) -> None:
-        data = {
-            **VALID_MAPPING,
-            "columns": {"Source_Col": 42},
-        }
-        path = _write_mapping(tmp_path, data)
-        result = load_column_mapping(path)
+    def test_non_string_target_value_errors(self, valid_mapping: dict[str, Any]) -> None:
+        valid_mapping["columns"] = {"Source_Col": 42}
+        result = load_column_mapping(_encode(valid_mapping))
         assert not result.is_valid
-        assert "string" in result.errors[0].lower()
+        assert re.search(r"(?i)string", result.errors[0])
 
 
 class TestToSchemaMapping:
@@ -181,35 +231,46 @@ class TestToSchemaMapping:
         assert len(sm.relationship_mappings) == 0
 
 
+@pytest.fixture(scope="session")
+def hr_export(
+    tmp_path_factory: pytest.TempPathFactory,
+    mapping_file_factory: Callable[[dict[str, Any]], Path],
+) -> tuple[Path, SchemaMapping]:
+    """Write the HR export CSV and its mapping once, returning the CSV and schema."""
+    root = tmp_path_factory.mktemp("mapping_e2e")
+
+    # Create a CSV with non-canonical column names
+    csv_path = root / "hr_export.csv"
+    csv_path.write_text(
+        "Full_Name,First,Last,Mail\n"
+        "Alice Smith,Alice,Smith,alice@acme.com\n"
+        "Bob Jones,Bob,Jones,bob@acme.com\n"
+    )
+
+    # Create mapping
+    mapping_data = {
+        "entity_type": "person",
+        "name_field": "Full_Name",
+        "columns": {
+            "First": "first_name",
+            "Last": "last_name",
+            "Mail": "email",
+        },
+    }
+    mapping_path = mapping_file_factory(mapping_data)
+
+    # Load mapping and convert
+    load_result = load_column_mapping(mapping_path)
+    assert load_result.is_valid
+    return csv_path, to_schema_mapping(load_result.mapping)  # type: ignore[arg-type]
+
+
 class TestMappingWithCsvIngestor:
-    def test_end_to_end_csv_with_mapping(self, tmp_path: Path) -> None:
+    def test_end_to_end_csv_with_mapping(self, hr_export: tuple[Path, SchemaMapping]) -> None:
         """Full round-trip: mapping file + CSV -> entities."""
         from ingest.csv_ingestor import CSVIngestor
 
-        # Create a CSV with non-canonical column names
-        csv_path = tmp_path / "hr_export.csv"
-        csv_path.write_text(
-            "Full_Name,First,Last,Mail\n"
-            "Alice Smith,Alice,Smith,alice@acme.com\n"
-            "Bob Jones,Bob,Jones,bob@acme.com\n"
-        )
-
-        # Create mapping
-        mapping_data = {
-            "entity_type": "person",
-            "name_field": "Full_Name",
-            "columns": {
-                "First": "first_name",
-                "Last": "last_name",
-                "Mail": "email",
-            },
-        }
-        mapping_path = _write_mapping(tmp_path, mapping_data)
-
-        # Load mapping and convert
-        load_result = load_column_mapping(mapping_path)
-        assert load_result.is_valid
-        sm = to_schema_mapping(load_result.mapping)  # type: ignore[arg-type]
+        csv_path, sm = hr_export
 
         # Ingest with mapping
         ingestor = CSVIngestor()
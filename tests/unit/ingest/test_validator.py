@@ -2,9 +2,169 @@
 
 from __future__ import annotations
 
+import json
+
+import pytest
+
 from domain.base import EntityType
 from ingest.validator import ValidationResult, validate_csv_import, validate_json_import
 
+# (data, expected substring in the first error or None when valid, expected
+# entity_count or None to skip) rows for inputs that only need a pass/fail check
+_VALIDATE_CASES = [
+    pytest.param({"relationships": []}, "Missing 'entities' key", None, id="missing_entities_key"),
+    pytest.param(
+        {"entities": "not a list"},
+        "'entities' must be a list",
+        None,
+        id="entities_not_a_list",
+    ),
+    pytest.param(
+        {"entities": [], "relationships": "bad"},
+        "'relationships' must be a list",
+        None,
+        id="relationships_not_a_list",
+    ),
+    pytest.param({"entities": []}, None, 0, id="empty_entities_list"),
+    pytest.param({"entities": ["not a dict"]}, "must be a dict", None, id="entity_not_a_dict"),
+    pytest.param(
+        {"entities": [{"name": "Test"}]},
+        "missing 'entity_type'",
+        None,
+        id="missing_entity_type",
+    ),
+    pytest.param(
+        {"entities": [{"entity_type": "bogus", "name": "Test"}]},
+        "invalid entity_type 'bogus'",
+        None,
+        id="invalid_entity_type",
+    ),
+    pytest.param(
+        {"entities": [{"entity_type": "department"}]},
+        "missing or empty 'name'",
+        None,
+        id="missing_name",
+    ),
+    pytest.param(
+        {"entities": [{"entity_type": "department", "name": "  "}]},
+        "missing or empty 'name'",
+        None,
+        id="empty_name",
+    ),
+    pytest.param(
+        {
+            "entities": [
+                {
+                    "entity_type": "person",
+                    "name": "Alice Smith",
+                    "first_name": "Alice",
+                    "last_name": "Smith",
+                    "email": "alice@acme.com",
+                }
+            ]
+        },
+        None,
+        1,
+        id="person_with_all_required",
+    ),
+    pytest.param(
+        {
+            "entities": [{"entity_type": "department", "name": "Eng"}],
+            "relationships": [
+                {"relationship_type": "fake_rel", "source_id": "a", "target_id": "b"}
+            ],
+        },
+        "invalid relationship_type 'fake_rel'",
+        None,
+        id="invalid_relationship_type",
+    ),
+    pytest.param(
+        {"entities": [], "relationships": [{"relationship_type": "works_in", "target_id": "d1"}]},
+        "missing 'source_id'",
+        None,
+        id="relationship_missing_source_id",
+    ),
+    pytest.param(
+        {"entities": [], "relationships": [{"relationship_type": "works_in", "source_id": "p1"}]},
+        "missing 'target_id'",
+        None,
+        id="relationship_missing_target_id",
+    ),
+    pytest.param(
+        {"entities": [], "relationships": [{"source_id": "p1", "target_id": "d1"}]},
+        "missing 'relationship_type'",
+        None,
+        id="relationship_missing_type",
+    ),
+    pytest.param(
+        {"entities": [], "relationships": ["not a dict"]},
+        "must be a dict",
+        None,
+        id="relationship_not_a_dict",
+    ),
+    pytest.param(
+        {
+            "entities": [{"entity_type": "department", "name": "Eng"}],
+            "relationships": [],
+            "statistics": {"entity_count": 1},
+        },
+        None,
+        1,
+        id="statistics_key_ignored",
+    ),
+    pytest.param(b"not json {{{", "Invalid JSON", None, id="invalid_json_bytes"),
+    pytest.param(b"\x80abc", "Invalid JSON", None, id="invalid_utf8_bytes"),
+    pytest.param(b"[1, 2, 3]", "JSON root must be an object", None, id="non_object_root"),
+]
+
+# Larger documents, serialized once at import and validated from raw bytes
+_PAYLOADS = {
+    name: json.dumps(doc).encode()
+    for name, doc in {
+        "person_missing_required": {"entities": [{"entity_type": "person", "name": "Alice"}]},
+        "unknown_fields": {
+            "entities": [
+                {
+                    "entity_type": "department",
+                    "name": "Engineering",
+                    "bogus_field": "value",
+                    "another_typo": 42,
+                }
+            ]
+        },
+        "dangling_reference": {
+            "entities": [{"entity_type": "department", "id": "d1", "name": "Eng"}],
+            "relationships": [
+                {
+                    "relationship_type": "works_in",
+                    "source_id": "missing-person",
+                    "target_id": "d1",
+                }
+            ],
+        },
+        "mixed_errors_and_warnings": {
+            "entities": [
+                {"entity_type": "department", "id": "d1", "name": "Eng", "typo_field": 1},
+                {"entity_type": "bogus", "name": "Bad"},
+            ],
+            "relationships": [
+                {
+                    "relationship_type": "works_in",
+                    "source_id": "missing",
+                    "target_id": "d1",
+                }
+            ],
+        },
+        "multiple_entity_types": {
+            "entities": [
+                {"entity_type": "department", "name": "A"},
+                {"entity_type": "department", "name": "B"},
+                {"entity_type": "system", "name": "C"},
+            ]
+        },
+    }.items()
+}
+
 
 class TestValidationResult:
     def test_is_valid_no_errors(self) -> None:
@@ -15,12 +175,36 @@ class TestValidationResult:
         vr = ValidationResult(errors=["some error"])
         assert vr.is_valid is False
 
+    def test_blobs_join_messages(self) -> None:
+        vr = ValidationResult(errors=["first", "second"], warnings=["only"])
+        assert vr.errors_blob == "first\nsecond"
+        assert vr.warnings_blob == "only"
+
+    def test_blobs_follow_appends(self) -> None:
+        vr = ValidationResult(errors=["a"])
+        assert vr.errors_blob == "a"
+        vr.errors.append("b")
+        assert vr.errors_blob == "a\nb"
+
     def test_warnings_dont_invalidate(self) -> None:
         vr = ValidationResult(warnings=["some warning"])
         assert vr.is_valid is True
 
 
 class TestValidateJsonImport:
+    @pytest.mark.parametrize(("data", "expected", "entity_count"), _VALIDATE_CASES)
+    def test_validate(
+        self, data: dict | bytes, expected: str | None, entity_count: int | None
+    ) -> None:
+        vr = validate_json_import(data)
+        assert vr.is_valid is (expected is None)
+        if expected is None:
+            assert not vr.errors
+        else:
+            assert expected in vr.errors[0]
+        if entity_count is not None:
+            assert vr.entity_count == entity_count
+
     def test_valid_data(self) -> None:
         data = {
             "entities": [
@@ -62,205 +246,37 @@ class TestValidateJsonImport:
         assert vr.relationship_count == 1
         assert vr.relationship_type_counts == {"works_in": 1}
 
-    def test_missing_entities_key(self) -> None:
-        data = {"relationships": []}
-        vr = validate_json_import(data)
-        assert not vr.is_valid
-        assert "Missing 'entities' key" in vr.errors[0]
-
-    def test_entities_not_a_list(self) -> None:
-        data = {"entities": "not a list"}
-        vr = validate_json_import(data)
-        assert not vr.is_valid
-        assert "'entities' must be a list" in vr.errors[0]
-
-    def test_relationships_not_a_list(self) -> None:
-        data = {"entities": [], "relationships": "bad"}
-        vr = validate_json_import(data)
-        assert not vr.is_valid
-        assert "'relationships' must be a list" in vr.errors[0]
-
-    def test_empty_entities_list(self) -> None:
-        data = {"entities": []}
-        vr = validate_json_import(data)
-        assert vr.is_valid
-        assert vr.entity_count == 0
-
-    def test_entity_not_a_dict(self) -> None:
-        data = {"entities": ["not a dict"]}
-        vr = validate_json_import(data)
-        assert not vr.is_valid
-        assert "must be a dict" in vr.errors[0]
-
-    def test_missing_entity_type(self) -> None:
-        data = {"entities": [{"name": "Test"}]}
-        vr = validate_json_import(data)
-        assert not vr.is_valid
-        assert "missing 'entity_type'" in vr.errors[0]
-
-    def test_invalid_entity_type(self) -> None:
-        data = {"entities": [{"entity_type": "bogus", "name": "Test"}]}
-        vr = validate_json_import(data)
-        assert not vr.is_valid
-        assert "invalid entity_type 'bogus'" in vr.errors[0]
-
-    def test_missing_name(self) -> None:
-        data = {"entities": [{"entity_type": "department"}]}
-        vr = validate_json_import(data)
-        assert not vr.is_valid
-        assert "missing or empty 'name'" in vr.errors[0]
-
-    def test_empty_name(self) -> None:
-        data = {"entities": [{"entity_type": "department", "name": "  "}]}
-        vr = validate_json_import(data)
-        assert not vr.is_valid
-        assert "missing or empty 'name'" in vr.errors[0]
-
     def test_person_missing_required_fields(self) -> None:
-        data = {"entities": [{"entity_type": "person", "name": "Alice"}]}
-        vr = validate_json_import(data)
+        vr = validate_json_import(_PAYLOADS["person_missing_required"])
         assert not vr.is_valid
-        assert any("first_name" in e for e in vr.errors)
-        assert any("last_name" in e for e in vr.errors)
-        assert any("email" in e for e in vr.errors)
-
-    def test_person_with_all_required(self) -> None:
-        data = {
-            "entities": [
-                {
-                    "entity_type": "person",
-                    "name": "Alice Smith",
-                    "first_name": "Alice",
-                    "last_name": "Smith",
-                    "email": "alice@acme.com",
-                }
-            ]
-        }
-        vr = validate_json_import(data)
-        assert vr.is_valid
-        assert not vr.errors
+        assert "first_name" in vr.errors_blob
+        assert "last_name" in vr.errors_blob
+        assert "email" in vr.errors_blob
 
     def test_unknown_fields_detected(self) -> None:
-        data = {
-            "entities": [
-                {
-                    "entity_type": "department",
-                    "name": "Engineering",
-                    "bogus_field": "value",
-                    "another_typo": 42,
-                }
-            ]
-        }
-        vr = validate_json_import(data)
+        vr = validate_json_import(_PAYLOADS["unknown_fields"])
         assert vr.is_valid  # warnings, not errors
         assert len(vr.warnings) == 1
         assert "unknown field" in vr.warnings[0].lower()
         assert "bogus_field" in vr.warnings[0]
 
-    def test_invalid_relationship_type(self) -> None:
-        data = {
-            "entities": [{"entity_type": "department", "name": "Eng"}],
-            "relationships": [
-                {"relationship_type": "fake_rel", "source_id": "a", "target_id": "b"}
-            ],
-        }
-        vr = validate_json_import(data)
-        assert not vr.is_valid
-        assert "invalid relationship_type 'fake_rel'" in vr.errors[0]
-
-    def test_relationship_missing_source_id(self) -> None:
-        data = {
-            "entities": [],
-            "relationships": [{"relationship_type": "works_in", "target_id": "d1"}],
-        }
-        vr = validate_json_import(data)
-        assert not vr.is_valid
-        assert any("missing 'source_id'" in e for e in vr.errors)
-
-    def test_relationship_missing_target_id(self) -> None:
-        data = {
-            "entities": [],
-            "relationships": [{"relationship_type": "works_in", "source_id": "p1"}],
-        }
-        vr = validate_json_import(data)
-        assert not vr.is_valid
-        assert any("missing 'target_id'" in e for e in vr.errors)
-
-    def test_relationship_missing_type(self) -> None:
-        data = {
-            "entities": [],
-            "relationships": [{"source_id": "p1", "target_id": "d1"}],
-        }
-        vr = validate_json_import(data)
-        assert not vr.is_valid
-        assert "missing 'relationship_type'" in vr.errors[0]
-
     def test_dangling_reference_warning(self) -> None:
-        data = {
-            "entities": [{"entity_type": "department", "id": "d1", "name": "Eng"}],
-            "relationships": [
-                {
-                    "relationship_type": "works_in",
-                    "source_id": "missing-person",
-                    "target_id": "d1",
-                }
-            ],
-        }
-        vr = validate_json_import(data)
+        vr = validate_json_import(_PAYLOADS["dangling_reference"])
         assert vr.is_valid  # dangling refs are warnings
-        assert any("missing-person" in w for w in vr.warnings)
+        assert "missing-person" in vr.warnings_blob
 
     def test_mixed_errors_and_warnings(self) -> None:
-        data = {
-            "entities": [
-                {"entity_type": "department", "id": "d1", "name": "Eng", "typo_field": 1},
-                {"entity_type": "bogus", "name": "Bad"},
-            ],
-            "relationships": [
-                {
-                    "relationship_type": "works_in",
-                    "source_id": "missing",
-                    "target_id": "d1",
-                }
-            ],
-        }
-        vr = validate_json_import(data)
+        vr = validate_json_import(_PAYLOADS["mixed_errors_and_warnings"])
         assert not vr.is_valid  # has errors from bogus type
         assert len(vr.errors) >= 1
         assert len(vr.warnings) >= 1
 
     def test_multiple_entity_types_counted(self) -> None:
-        data = {
-            "entities": [
-                {"entity_type": "department", "name": "A"},
-                {"entity_type": "department", "name": "B"},
-                {"entity_type": "system", "name": "C"},
-            ]
-        }
-        vr = validate_json_import(data)
+        vr = validate_json_import(_PAYLOADS["multiple_entity_types"])
         assert vr.is_valid
         assert vr.entity_type_counts == {"department": 2, "system": 1}
         assert vr.entity_count == 3
 
-    def test_relationship_not_a_dict(self) -> None:
-        data = {
-            "entities": [],
-            "relationships": ["not a dict"],
-        }
-        vr = validate_json_import(data)
-        assert not vr.is_valid
-        assert "must be a dict" in vr.errors[0]
-
-    def test_statistics_key_ignored(self) -> None:
-        """Exported JSON includes 'statistics' — validator should ignore it."""
-        data = {
-            "entities": [{"entity_type": "department", "name": "Eng"}],
-            "relationships": [],
-            "statistics": {"entity_count": 1},
-        }
-        vr = validate_json_import(data)
-        assert vr.is_valid
-
 
 class TestValidateCsvImport:
     def test_valid_person_headers(self) -> None:
@@ -291,9 +307,9 @@ class TestValidateCsvImport:
         headers = ["name", "title"]
         vr = validate_csv_import(headers, EntityType.PERSON)
         assert not vr.is_valid
-        assert any("first_name" in e for e in vr.errors)
-        assert any("last_name" in e for e in vr.errors)
-        assert any("email" in e for e in vr.errors)
+        assert "first_name" in vr.errors_blob
+        assert "last_name" in vr.errors_blob
+        assert "email" in vr.errors_blob
 
     def test_non_person_no_required_columns(self) -> None:
         """Non-person entities only require 'name' (from BaseEntity, always present)."""
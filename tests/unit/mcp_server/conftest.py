@@ -0,0 +1,138 @@
+"""Shared fixtures for MCP server tests.
+
+Session-scoped graphs are built once per process, so under pytest-xdist
+(``make test-parallel``) each worker builds its own copy. No test writes
+to a shared graph file -- tests that modify one work on a copy in a
+per-test or per-class temporary directory, which lives under the worker's
+own base temp -- so these modules need no xdist grouping.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from graph.knowledge_graph import KnowledgeGraph
+
+
+@pytest.fixture(autouse=True)
+def _reset_server_state() -> Iterator[None]:
+    """Ensure each test starts and ends with a clean MCP server state."""
+    import mcp_server.state as state
+
+    state._kg = None
+    state._loaded_path = None
+    state._loaded_mtime = 0.0
+    yield
+    state._kg = None
+    state._loaded_path = None
+    state._loaded_mtime = 0.0
+
+
+@pytest.fixture(scope="session")
+def synthetic_kg() -> KnowledgeGraph:
+    """Generate a small synthetic KG once per session. Tests must treat it as read-only.
+
+    Three employees is the smallest profile the tests need: departments
+    (including "Engineering"), systems and policies are generated whatever
+    the headcount, so the graph still has people, neighbours and well over
+    the five entities the reload test truncates to.
+    """
+    from graph.knowledge_graph import KnowledgeGraph
+    from synthetic.orchestrator import SyntheticOrchestrator
+    from synthetic.profiles.tech_company import mid_size_tech_company
+
+    kg = KnowledgeGraph()
+    profile = mid_size_tech_company(3)
+    SyntheticOrchestrator(kg, profile, seed=42).generate()
+    return kg
+
+
+@pytest.fixture(scope="session")
+def graph_json_path(synthetic_kg: KnowledgeGraph, tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Export the session KG to JSON and return the path.
+
+    The file is shared by every MCP test; tests that rewrite it must work on
+    a copy under their own ``tmp_path``.
+    """
+    from export.json_export import JSONExporter
+
+    path = tmp_path_factory.mktemp("kg") / "kg.json"
+    JSONExporter().export(synthetic_kg.engine, path)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def tiny_graph_json_path(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Export a four-entity KG for tests that only need *a* graph file to load.
+
+    Load/reload tests parse the file on every call, so keeping it tiny keeps
+    those tests cheap. Tests that inspect graph content use ``graph_json_path``.
+    """
+    from domain.base import BaseRelationship, RelationshipType
+    from domain.entities.department import Department
+    from domain.entities.person import Person
+    from domain.entities.system import System
+    from export.json_export import JSONExporter
+    from graph.knowledge_graph import KnowledgeGraph
+
+    kg = KnowledgeGraph()
+    kg.add_entities_bulk(
+        [
+            Person(
+                id="per-001",
+                name="Alice Smith",
+                first_name="Alice",
+                last_name="Smith",
+                email="alice@test.com",
+            ),
+            Department(id="dept-001", name="Engineering"),
+            System(id="sys-001", name="Auth Service"),
+            System(id="sys-002", name="DB Service"),
+        ]
+    )
+    kg.add_relationships_bulk(
+        [
+            BaseRelationship(
+                relationship_type=RelationshipType.WORKS_IN,
+                source_id="per-001",
+                target_id="dept-001",
+            ),
+            BaseRelationship(
+                relationship_type=RelationshipType.RESPONSIBLE_FOR,
+                source_id="dept-001",
+                target_id="sys-001",
+            ),
+        ]
+    )
+
+    path = tmp_path_factory.mktemp("tiny_kg") / "kg.json"
+    JSONExporter().export(kg.engine, path)
+    return str(path)
+
+
+@pytest.fixture
+def installed_graph(
+    synthetic_kg: KnowledgeGraph, graph_json_path: str, monkeypatch: pytest.MonkeyPatch
+) -> KnowledgeGraph:
+    """Install the in-memory session graph as if it had been loaded from disk.
+
+    The graph never round-trips through JSON for these tests; only the
+    ``load_graph`` tests exercise the real file path.
+
+    ``_loaded_path``/``_loaded_mtime`` match the file on disk, so
+    ``require_graph`` sees no change and never reloads.
+    """
+    import mcp_server.state as state
+
+    resolved = Path(graph_json_path).resolve()
+    monkeypatch.setattr(state, "_kg", synthetic_kg)
+    monkeypatch.setattr(state, "_loaded_path", str(resolved))
+    monkeypatch.setattr(state, "_loaded_mtime", os.path.getmtime(resolved))
+    return synthetic_kg
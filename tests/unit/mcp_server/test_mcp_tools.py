@@ -7,54 +7,33 @@ through the MCP transport layer.
 from __future__ import annotations
 
 import json
-import tempfile
-import time
+import os
+import shutil
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 
 mcp_available = pytest.importorskip("mcp", reason="mcp package not installed")
 import mcp_server.state as state  # noqa: E402
-from export.json_export import JSONExporter  # noqa: E402
-from graph.knowledge_graph import KnowledgeGraph  # noqa: E402
 from mcp_server.server import mcp  # noqa: E402
-from synthetic.orchestrator import SyntheticOrchestrator  # noqa: E402
-from synthetic.profiles.tech_company import mid_size_tech_company  # noqa: E402
+
+if TYPE_CHECKING:
+    from graph.knowledge_graph import KnowledgeGraph
+
+
+# FastMCP keeps registered tools in a dict keyed by name; snapshot the
+# callables once so each call is a single lookup
+_TOOLS = {name: tool.fn for name, tool in mcp._tool_manager._tools.items()}
 
 
 def _call_tool(name: str, **kwargs):
     """Call an MCP tool by name via the FastMCP registry."""
-    # FastMCP stores tools in _tool_manager; access them directly for testing
-    for tool in mcp._tool_manager._tools.values():
-        if tool.name == name:
-            return tool.fn(**kwargs)
-    raise ValueError(f"Tool '{name}' not found")
-
-
-@pytest.fixture(scope="module")
-def graph_json_path() -> str:
-    """Generate a small synthetic KG, export to a temp JSON file, return the path."""
-    kg = KnowledgeGraph()
-    profile = mid_size_tech_company(20)
-    SyntheticOrchestrator(kg, profile, seed=42).generate()
-
-    exporter = JSONExporter()
-    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
-        tmp_path = tmp.name
-    exporter.export(kg.engine, Path(tmp_path))
-    return tmp_path
-
-
-@pytest.fixture(autouse=True)
-def _reset_server_state():
-    """Ensure each test starts with a clean server state."""
-    state._kg = None
-    state._loaded_path = None
-    state._loaded_mtime = 0.0
-    yield
-    state._kg = None
-    state._loaded_path = None
-    state._loaded_mtime = 0.0
+    try:
+        fn = _TOOLS[name]
+    except KeyError:
+        raise ValueError(f"Tool '{name}' not found") from None
+    return fn(**kwargs)
 
 
 # ---------------------------------------------------------------
@@ -87,8 +66,7 @@ class TestGetStatistics:
         assert "error" in result
         assert "load_graph" in result["error"].lower()
 
-    def test_get_statistics_after_load(self, graph_json_path: str):
-        state.load_graph(graph_json_path)
+    def test_get_statistics_after_load(self, installed_graph: KnowledgeGraph):
         result = _call_tool("get_statistics")
         assert "entity_count" in result
         assert result["entity_count"] > 0
@@ -100,8 +78,7 @@ class TestGetStatistics:
 
 
 class TestListEntities:
-    def test_list_entities_all(self, graph_json_path: str):
-        state.load_graph(graph_json_path)
+    def test_list_entities_all(self, installed_graph: KnowledgeGraph):
         result = _call_tool("list_entities")
         assert isinstance(result, list)
         assert len(result) > 0
@@ -109,20 +86,17 @@ class TestListEntities:
         assert "name" in result[0]
         assert "entity_type" in result[0]
 
-    def test_list_entities_by_type(self, graph_json_path: str):
-        state.load_graph(graph_json_path)
+    def test_list_entities_by_type(self, installed_graph: KnowledgeGraph):
         result = _call_tool("list_entities", entity_type="person")
         assert isinstance(result, list)
         assert len(result) > 0
         assert all(e["entity_type"] == "person" for e in result)
 
-    def test_list_entities_respects_limit(self, graph_json_path: str):
-        state.load_graph(graph_json_path)
+    def test_list_entities_respects_limit(self, installed_graph: KnowledgeGraph):
         result = _call_tool("list_entities", limit=3)
         assert len(result) <= 3
 
-    def test_list_entities_invalid_type(self, graph_json_path: str):
-        state.load_graph(graph_json_path)
+    def test_list_entities_invalid_type(self, installed_graph: KnowledgeGraph):
         result = _call_tool("list_entities", entity_type="unicorn")
         assert isinstance(result, list)
         assert "error" in result[0]
@@ -134,8 +108,7 @@ class TestListEntities:
 
 
 class TestGetEntity:
-    def test_get_entity_found(self, graph_json_path: str):
-        state.load_graph(graph_json_path)
+    def test_get_entity_found(self, installed_graph: KnowledgeGraph):
         entities = _call_tool("list_entities", entity_type="person", limit=1)
         entity_id = entities[0]["id"]
 
@@ -143,8 +116,7 @@ class TestGetEntity:
         assert result["id"] == entity_id
         assert "name" in result
 
-    def test_get_entity_not_found(self, graph_json_path: str):
-        state.load_graph(graph_json_path)
+    def test_get_entity_not_found(self, installed_graph: KnowledgeGraph):
         result = _call_tool("get_entity", entity_id="nonexistent-id-12345")
         assert "error" in result
 
@@ -155,8 +127,7 @@ class TestGetEntity:
 
 
 class TestGetNeighbors:
-    def test_get_neighbors(self, graph_json_path: str):
-        state.load_graph(graph_json_path)
+    def test_get_neighbors(self, installed_graph: KnowledgeGraph):
         entities = _call_tool("list_entities", entity_type="person", limit=1)
         entity_id = entities[0]["id"]
 
@@ -173,15 +144,13 @@ class TestGetNeighbors:
 
 
 class TestSearchEntities:
-    def test_search_entities_finds_match(self, graph_json_path: str):
-        state.load_graph(graph_json_path)
+    def test_search_entities_finds_match(self, installed_graph: KnowledgeGraph):
         result = _call_tool("search_entities", query="Engineering")
         assert isinstance(result, list)
         assert len(result) > 0
         assert "match_score" in result[0]
 
-    def test_search_entities_no_match(self, graph_json_path: str):
-        state.load_graph(graph_json_path)
+    def test_search_entities_no_match(self, installed_graph: KnowledgeGraph):
         result = _call_tool("search_entities", query="zzzzxqnonexistent9999")
         assert isinstance(result, list)
         for entry in result:
@@ -195,30 +164,26 @@ class TestSearchEntities:
 
 
 class TestAdditionalTools:
-    def test_find_most_connected(self, graph_json_path: str):
-        state.load_graph(graph_json_path)
+    def test_find_most_connected(self, installed_graph: KnowledgeGraph):
         result = _call_tool("find_most_connected", top_n=5)
         assert isinstance(result, list)
         assert len(result) <= 5
         if result:
             assert "degree" in result[0]
 
-    def test_compute_centrality_degree(self, graph_json_path: str):
-        state.load_graph(graph_json_path)
+    def test_compute_centrality_degree(self, installed_graph: KnowledgeGraph):
         result = _call_tool("compute_centrality", metric="degree")
         assert isinstance(result, list)
         assert len(result) <= 20
         if result:
             assert "score" in result[0]
 
-    def test_compute_centrality_invalid(self, graph_json_path: str):
-        state.load_graph(graph_json_path)
+    def test_compute_centrality_invalid(self, installed_graph: KnowledgeGraph):
         result = _call_tool("compute_centrality", metric="invalid_metric")
         assert isinstance(result, list)
         assert "error" in result[0]
 
-    def test_get_blast_radius(self, graph_json_path: str):
-        state.load_graph(graph_json_path)
+    def test_get_blast_radius(self, installed_graph: KnowledgeGraph):
         entities = _call_tool("list_entities", limit=1)
         entity_id = entities[0]["id"]
 
@@ -237,8 +202,8 @@ class TestAdditionalTools:
 
 
 class TestAutoLoadDefaultGraph:
-    def test_auto_load_from_env(self, graph_json_path: str, monkeypatch):
-        monkeypatch.setenv("HCKG_DEFAULT_GRAPH", graph_json_path)
+    def test_auto_load_from_env(self, tiny_graph_json_path: str, monkeypatch):
+        monkeypatch.setenv("HCKG_DEFAULT_GRAPH", tiny_graph_json_path)
         state.auto_load_default_graph()
         assert state._kg is not None
         assert state._kg.statistics["entity_count"] > 0
@@ -262,13 +227,14 @@ class TestAutoLoadDefaultGraph:
 class TestAutoReload:
     """Verify mtime-based auto-reload of the graph file."""
 
-    def test_reload_detects_file_change(self, graph_json_path: str):
+    def test_reload_detects_file_change(self, graph_json_path: str, tmp_path: Path):
         """After loading a graph, modifying the file triggers a reload."""
+        # Rewrite a copy so the session-wide graph file stays intact
+        graph_json_path = str(shutil.copy(graph_json_path, tmp_path / "kg.json"))
         state.load_graph(graph_json_path)
         original_count = state._kg.statistics["entity_count"]
         original_mtime = state._loaded_mtime
-
-        time.sleep(0.05)
+        original_mtime_ns = Path(graph_json_path).stat().st_mtime_ns
 
         with open(graph_json_path) as f:
             data = json.load(f)
@@ -277,14 +243,18 @@ class TestAutoReload:
         with open(graph_json_path, "w") as f:
             json.dump(data, f)
 
+        # Bump mtime explicitly instead of sleeping past the filesystem's resolution
+        new_mtime_ns = original_mtime_ns + 1_000_000_000
+        os.utime(graph_json_path, ns=(new_mtime_ns, new_mtime_ns))
+
         kg = state.require_graph()
         assert kg.statistics["entity_count"] == 5
         assert kg.statistics["entity_count"] != original_count
         assert state._loaded_mtime != original_mtime
 
-    def test_no_reload_when_file_unchanged(self, graph_json_path: str):
+    def test_no_reload_when_file_unchanged(self, tiny_graph_json_path: str):
         """When the file hasn't changed, require_graph returns the same instance."""
-        state.load_graph(graph_json_path)
+        state.load_graph(tiny_graph_json_path)
         kg_before = state._kg
         mtime_before = state._loaded_mtime
 
@@ -292,25 +262,24 @@ class TestAutoReload:
         assert kg_after is kg_before
         assert state._loaded_mtime == mtime_before
 
-    def test_reload_graceful_when_file_deleted(self, graph_json_path: str):
+    def test_reload_graceful_when_file_deleted(self, tiny_graph_json_path: str, tmp_path: Path):
         """If the graph file is deleted, the server keeps the last loaded graph."""
-        state.load_graph(graph_json_path)
+        state.load_graph(tiny_graph_json_path)
 
-        with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as tmp:
-            tmp.write(Path(graph_json_path).read_bytes())
-            tmp_path = tmp.name
+        copy_path = tmp_path / "copy.json"
+        shutil.copy(tiny_graph_json_path, copy_path)
 
-        state.load_graph(tmp_path)
-        Path(tmp_path).unlink()
+        state.load_graph(str(copy_path))
+        copy_path.unlink()
 
         kg = state.require_graph()
         assert kg is not None
 
-    def test_loaded_path_set_after_load(self, graph_json_path: str):
+    def test_loaded_path_set_after_load(self, tiny_graph_json_path: str):
         """load_graph sets _loaded_path and _loaded_mtime."""
         assert state._loaded_path is None
         assert state._loaded_mtime == 0.0
 
-        state.load_graph(graph_json_path)
-        assert state._loaded_path == str(Path(graph_json_path).resolve())
+        state.load_graph(tiny_graph_json_path)
+        assert state._loaded_path == str(Path(tiny_graph_json_path).resolve())
         assert state._loaded_mtime > 0
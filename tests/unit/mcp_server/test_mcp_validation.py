@@ -19,9 +19,6 @@ from mcp_server.validation import (  # noqa: E402
     validate_relationship_type,
 )
 
-EntityRegistry.auto_discover()
-
-
 # -- helpers --
 
 
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import copy
 import json
+import re
 from pathlib import Path
 
 import pytest
@@ -16,19 +18,46 @@ from export.json_export import JSONExporter  # noqa: E402
 from graph.knowledge_graph import KnowledgeGraph  # noqa: E402
 from mcp_server.server import mcp  # noqa: E402
 
-EntityRegistry.auto_discover()
+# FastMCP keeps registered tools in a dict keyed by name; snapshot the
+# callables once so each call is a single lookup
+_TOOLS = {name: tool.fn for name, tool in mcp._tool_manager._tools.items()}
 
 
 def _call_tool(tool_name: str, **kwargs):
     """Call an MCP tool by name via the FastMCP registry."""
-    for tool in mcp._tool_manager._tools.values():
-        if tool.name == tool_name:
-            return tool.fn(**kwargs)
-    raise ValueError(f"Tool '{tool_name}' not found")
+    try:
+        fn = _TOOLS[tool_name]
+    except KeyError:
+        raise ValueError(f"Tool '{tool_name}' not found") from None
+    return fn(**kwargs)
 
 
-def _build_test_kg(tmp_path: Path) -> str:
-    """Create a minimal KG with Person + Department + System, export, load into state."""
+def _read_graph_file(path: str) -> dict:
+    """Parse the graph file as persisted by the write tools."""
+    # json.loads accepts bytes, so skip decoding to str first
+    return json.loads(Path(path).read_bytes())
+
+
+def _counts() -> tuple[int, int]:
+    """Return the loaded graph's (entity, relationship) counts.
+
+    Reads the engine counters directly; ``statistics`` also computes
+    density and connectivity, which these tests never look at.
+    """
+    engine = state._kg.engine
+    return engine.entity_count(), engine.relationship_count()
+
+
+@pytest.fixture(scope="session")
+def _write_kg_template(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> tuple[KnowledgeGraph, bytes]:
+    """Build the Person + Department + System KG once and export it.
+
+    Returns the graph and its exported JSON so each test can restore a
+    private copy without rebuilding or re-serializing it. Tests never touch
+    the template graph itself.
+    """
     person_cls = EntityRegistry.get(EntityType.PERSON)
     dept_cls = EntityRegistry.get(EntityType.DEPARTMENT)
     system_cls = EntityRegistry.get(EntityType.SYSTEM)
@@ -47,225 +76,167 @@ def _build_test_kg(tmp_path: Path) -> str:
     kg.add_entity(system_cls(id="sys-001", name="Auth Service"))
     kg.add_entity(system_cls(id="sys-002", name="DB Service"))
 
-    json_path = tmp_path / "test_graph.json"
+    json_path = tmp_path_factory.mktemp("write_kg") / "test_graph.json"
     JSONExporter().export(kg.engine, json_path)
-    state._kg = kg
-    state._loaded_path = str(json_path)
-    state._loaded_mtime = json_path.stat().st_mtime
-    return str(json_path)
+    return kg, json_path.read_bytes()
 
 
-@pytest.fixture(autouse=True)
-def _reset_state():
-    """Clean server state before and after each test."""
-    state._kg = None
-    state._loaded_path = None
-    state._loaded_mtime = 0.0
-    yield
-    state._kg = None
-    state._loaded_path = None
-    state._loaded_mtime = 0.0
+@pytest.fixture(scope="class")
+def class_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One scratch directory per test class; its tests take turns on one graph file."""
+    return tmp_path_factory.mktemp("write_tools")
 
 
-# -- add_relationship_tool --
+@pytest.fixture
+def loaded_graph(_write_kg_template: tuple[KnowledgeGraph, bytes], class_tmp: Path) -> str:
+    """Load a fresh copy of the template KG into state and return its file path.
 
+    Nothing is written up front: the first mutating tool call persists the
+    graph to this path. Until then ``require_graph`` finds no file and keeps
+    the in-memory graph, so a file left by an earlier test in the class is
+    removed first.
+    """
+    json_path = class_tmp / "test_graph.json"
+    json_path.unlink(missing_ok=True)
+    state._kg = copy.deepcopy(_write_kg_template[0])
+    state._loaded_path = str(json_path)
+    state._loaded_mtime = 0.0
+    return state._loaded_path
 
-class TestAddRelationshipTool:
-    def test_valid_relationship(self, tmp_path):
-        _build_test_kg(tmp_path)
-        result = _call_tool(
-            "add_relationship_tool",
-            relationship_type="works_in",
-            source_id="per-001",
-            target_id="dept-001",
-        )
-        assert result["status"] == "ok"
-        assert "relationship_id" in result
-        assert result["relationship"]["relationship_type"] == "works_in"
-        assert result["relationship"]["source_id"] == "per-001"
-        assert result["relationship"]["target_id"] == "dept-001"
 
-    def test_system_depends_on_system(self, tmp_path):
-        _build_test_kg(tmp_path)
-        result = _call_tool(
-            "add_relationship_tool",
-            relationship_type="depends_on",
-            source_id="sys-001",
-            target_id="sys-002",
-        )
-        assert result["status"] == "ok"
+@pytest.fixture
+def exported_graph(loaded_graph: str, _write_kg_template: tuple[KnowledgeGraph, bytes]) -> str:
+    """Like ``loaded_graph``, but with the template export on disk, as after a real load."""
+    json_path = Path(loaded_graph)
+    json_path.write_bytes(_write_kg_template[1])
+    state._loaded_mtime = json_path.stat().st_mtime
+    return loaded_graph
 
-    def test_invalid_relationship_type(self, tmp_path):
-        _build_test_kg(tmp_path)
-        result = _call_tool(
-            "add_relationship_tool",
-            relationship_type="not_a_real_type",
-            source_id="per-001",
-            target_id="dept-001",
-        )
-        assert "error" in result
-        assert "Unknown relationship_type" in result["error"]
 
-    def test_missing_source_entity(self, tmp_path):
-        _build_test_kg(tmp_path)
-        result = _call_tool(
-            "add_relationship_tool",
-            relationship_type="works_in",
-            source_id="per-999",
-            target_id="dept-001",
-        )
-        assert "error" in result
-        assert "not found" in result["error"].lower()
+# -- add_relationship_tool --
 
-    def test_missing_target_entity(self, tmp_path):
-        _build_test_kg(tmp_path)
-        result = _call_tool(
-            "add_relationship_tool",
-            relationship_type="works_in",
-            source_id="per-001",
-            target_id="dept-999",
-        )
-        assert "error" in result
-        assert "not found" in result["error"].lower()
 
-    def test_schema_violation(self, tmp_path):
-        """works_in requires Person -> Department, not System -> System."""
-        _build_test_kg(tmp_path)
-        result = _call_tool(
-            "add_relationship_tool",
-            relationship_type="works_in",
-            source_id="sys-001",
-            target_id="sys-002",
-        )
-        assert "error" in result
+# Relationship payloads shared by the add/batch tests
+_WORKS_IN = {"relationship_type": "works_in", "source_id": "per-001", "target_id": "dept-001"}
+_DEPENDS_ON = {"relationship_type": "depends_on", "source_id": "sys-001", "target_id": "sys-002"}
+
+# One item over add_relationships_batch's 500-item limit
+_OVERFLOW_BATCH = (_WORKS_IN,) * 501
+
+# (tool kwargs, expected subset of the returned relationship) for accepted calls
+_ADD_RELATIONSHIP_OK = [
+    pytest.param(_WORKS_IN, _WORKS_IN, id="works_in"),
+    pytest.param(_DEPENDS_ON, {}, id="system_depends_on_system"),
+    pytest.param(
+        {**_DEPENDS_ON, "properties": {"context": "authentication"}},
+        {"properties": {"context": "authentication"}},
+        id="with_properties",
+    ),
+    pytest.param(_WORKS_IN, {"weight": 1.0, "confidence": 1.0}, id="default_weight_and_confidence"),
+    pytest.param(
+        {**_WORKS_IN, "weight": 0.5, "confidence": 0.8},
+        {"weight": 0.5, "confidence": 0.8},
+        id="custom_weight_and_confidence",
+    ),
+    pytest.param(
+        {**_WORKS_IN, "weight": 5.0, "confidence": -1.0},
+        {"weight": 1.0, "confidence": 0.0},
+        id="weight_clamped",
+    ),
+]
+
+# (tool kwargs, error pattern or None) for rejected calls
+_ADD_RELATIONSHIP_ERRORS = [
+    pytest.param(
+        {**_WORKS_IN, "relationship_type": "not_a_real_type"},
+        "Unknown relationship_type",
+        id="invalid_relationship_type",
+    ),
+    pytest.param({**_WORKS_IN, "source_id": "per-999"}, "(?i)not found", id="missing_source"),
+    pytest.param({**_WORKS_IN, "target_id": "dept-999"}, "(?i)not found", id="missing_target"),
+    # works_in requires Person -> Department, not System -> System
+    pytest.param({**_DEPENDS_ON, "relationship_type": "works_in"}, None, id="schema_violation"),
+]
 
-    def test_persists_to_disk(self, tmp_path):
-        json_path = _build_test_kg(tmp_path)
-        _call_tool(
-            "add_relationship_tool",
-            relationship_type="works_in",
-            source_id="per-001",
-            target_id="dept-001",
-        )
-        # Re-read from disk and verify relationship is there
-        data = json.loads(Path(json_path).read_text())
-        rel_types = [r["relationship_type"] for r in data["relationships"]]
-        assert "works_in" in rel_types
 
-    def test_with_properties(self, tmp_path):
-        _build_test_kg(tmp_path)
-        result = _call_tool(
-            "add_relationship_tool",
-            relationship_type="depends_on",
-            source_id="sys-001",
-            target_id="sys-002",
-            properties={"context": "authentication"},
-        )
+class TestAddRelationshipTool:
+    @pytest.mark.parametrize(("kwargs", "expected"), _ADD_RELATIONSHIP_OK)
+    def test_accepted(self, loaded_graph, kwargs, expected):
+        result = _call_tool("add_relationship_tool", **kwargs)
         assert result["status"] == "ok"
-        assert result["relationship"]["properties"]["context"] == "authentication"
-
-    def test_default_weight_and_confidence(self, tmp_path):
-        _build_test_kg(tmp_path)
-        result = _call_tool(
-            "add_relationship_tool",
-            relationship_type="works_in",
-            source_id="per-001",
-            target_id="dept-001",
-        )
-        assert result["relationship"]["weight"] == 1.0
-        assert result["relationship"]["confidence"] == 1.0
+        assert "relationship_id" in result
+        rel = result["relationship"]
+        for key, value in expected.items():
+            assert rel[key] == value
 
-    def test_custom_weight_and_confidence(self, tmp_path):
-        _build_test_kg(tmp_path)
-        result = _call_tool(
-            "add_relationship_tool",
-            relationship_type="works_in",
-            source_id="per-001",
-            target_id="dept-001",
-            weight=0.5,
-            confidence=0.8,
-        )
-        assert result["relationship"]["weight"] == 0.5
-        assert result["relationship"]["confidence"] == 0.8
+    @pytest.mark.parametrize(("kwargs", "pattern"), _ADD_RELATIONSHIP_ERRORS)
+    def test_rejected(self, loaded_graph, kwargs, pattern):
+        result = _call_tool("add_relationship_tool", **kwargs)
+        assert "error" in result
+        if pattern is not None:
+            assert re.search(pattern, result["error"])
 
-    def test_weight_clamped(self, tmp_path):
-        _build_test_kg(tmp_path)
-        result = _call_tool(
-            "add_relationship_tool",
-            relationship_type="works_in",
-            source_id="per-001",
-            target_id="dept-001",
-            weight=5.0,
-            confidence=-1.0,
-        )
-        assert result["status"] == "ok"
-        assert result["relationship"]["weight"] == 1.0
-        assert result["relationship"]["confidence"] == 0.0
+    def test_persists_to_disk(self, exported_graph):
+        _call_tool("add_relationship_tool", **_WORKS_IN)
+        # Re-read from disk and verify relationship is there
+        data = _read_graph_file(exported_graph)
+        assert any(r["relationship_type"] == "works_in" for r in data["relationships"])
 
     def test_no_graph_loaded(self):
-        result = _call_tool(
-            "add_relationship_tool",
-            relationship_type="works_in",
-            source_id="per-001",
-            target_id="dept-001",
-        )
+        result = _call_tool("add_relationship_tool", **_WORKS_IN)
         assert "error" in result
         assert "No graph loaded" in result["error"]
 
-    def test_relationship_count_increases(self, tmp_path):
-        _build_test_kg(tmp_path)
-        stats_before = state._kg.statistics["relationship_count"]
-        _call_tool(
-            "add_relationship_tool",
-            relationship_type="works_in",
-            source_id="per-001",
-            target_id="dept-001",
-        )
-        stats_after = state._kg.statistics["relationship_count"]
-        assert stats_after == stats_before + 1
+    def test_relationship_count_increases(self, loaded_graph):
+        _, before = _counts()
+        _call_tool("add_relationship_tool", **_WORKS_IN)
+        assert _counts()[1] == before + 1
 
 
 # -- add_relationships_batch --
 
 
 class TestAddRelationshipsBatch:
-    def test_valid_batch(self, tmp_path):
-        _build_test_kg(tmp_path)
+    def test_valid_batch(self, loaded_graph):
         result = _call_tool(
             "add_relationships_batch",
             relationships=[
-                {"relationship_type": "works_in", "source_id": "per-001", "target_id": "dept-001"},
-                {"relationship_type": "depends_on", "source_id": "sys-001", "target_id": "sys-002"},
+                _WORKS_IN,
+                {
+                    **_DEPENDS_ON,
+                    "weight": 0.7,
+                    "confidence": 0.9,
+                    "properties": {"context": "auth"},
+                },
             ],
         )
         assert result["status"] == "ok"
         assert result["committed"] == 2
-        assert len(result["relationships"]) == 2
+        first, second = (item["relationship"] for item in result["relationships"])
+        assert first["relationship_type"] == "works_in"
+        assert first["weight"] == 1.0
+        assert first["confidence"] == 1.0
+        assert second["relationship_type"] == "depends_on"
+        assert second["weight"] == 0.7
+        assert second["confidence"] == 0.9
+        assert second["properties"]["context"] == "auth"
 
-    def test_single_item_batch(self, tmp_path):
-        _build_test_kg(tmp_path)
+    def test_single_item_batch(self, loaded_graph):
         result = _call_tool(
             "add_relationships_batch",
-            relationships=[
-                {"relationship_type": "works_in", "source_id": "per-001", "target_id": "dept-001"},
-            ],
+            relationships=[_WORKS_IN],
         )
         assert result["status"] == "ok"
         assert result["committed"] == 1
 
-    def test_validation_failure_rejects_all(self, tmp_path):
+    def test_validation_failure_rejects_all(self, loaded_graph):
         """If any item fails validation, nothing is committed."""
-        _build_test_kg(tmp_path)
-        count_before = state._kg.statistics["relationship_count"]
+        counts_before = _counts()
         result = _call_tool(
             "add_relationships_batch",
             relationships=[
-                {"relationship_type": "works_in", "source_id": "per-001", "target_id": "dept-001"},
-                {
-                    "relationship_type": "not_a_real_type",
-                    "source_id": "per-001",
-                    "target_id": "dept-001",
-                },
+                _WORKS_IN,
+                {**_WORKS_IN, "relationship_type": "not_a_real_type"},
             ],
         )
         assert result["status"] == "error"
@@ -273,11 +244,9 @@ class TestAddRelationshipsBatch:
         assert len(result["errors"]) == 1
         assert result["errors"][0]["index"] == 1
         # Verify nothing was committed
-        count_after = state._kg.statistics["relationship_count"]
-        assert count_after == count_before
+        assert _counts() == counts_before
 
-    def test_missing_required_field(self, tmp_path):
-        _build_test_kg(tmp_path)
+    def test_missing_required_field(self, loaded_graph):
         result = _call_tool(
             "add_relationships_batch",
             relationships=[
@@ -287,80 +256,39 @@ class TestAddRelationshipsBatch:
         assert result["status"] == "error"
         assert "Missing required field" in result["errors"][0]["error"]
 
-    def test_empty_list(self, tmp_path):
-        _build_test_kg(tmp_path)
+    def test_empty_list(self, loaded_graph):
         result = _call_tool("add_relationships_batch", relationships=[])
         assert "error" in result
         assert "Empty" in result["error"]
 
-    def test_batch_limit_exceeded(self, tmp_path):
-        _build_test_kg(tmp_path)
-        item = {"relationship_type": "works_in", "source_id": "per-001", "target_id": "dept-001"}
-        big_list = [item] * 501
-        result = _call_tool("add_relationships_batch", relationships=big_list)
+    def test_batch_limit_exceeded(self, loaded_graph):
+        result = _call_tool("add_relationships_batch", relationships=list(_OVERFLOW_BATCH))
         assert "error" in result
         assert "500" in result["error"]
 
-    def test_batch_persists_to_disk(self, tmp_path):
-        json_path = _build_test_kg(tmp_path)
+    def test_batch_persists_to_disk(self, exported_graph):
         _call_tool(
             "add_relationships_batch",
-            relationships=[
-                {"relationship_type": "works_in", "source_id": "per-001", "target_id": "dept-001"},
-                {"relationship_type": "depends_on", "source_id": "sys-001", "target_id": "sys-002"},
-            ],
+            relationships=[_WORKS_IN, _DEPENDS_ON],
         )
-        data = json.loads(Path(json_path).read_text())
-        rel_types = [r["relationship_type"] for r in data["relationships"]]
-        assert "works_in" in rel_types
-        assert "depends_on" in rel_types
-
-    def test_batch_with_weight_and_properties(self, tmp_path):
-        _build_test_kg(tmp_path)
-        result = _call_tool(
-            "add_relationships_batch",
-            relationships=[
-                {
-                    "relationship_type": "depends_on",
-                    "source_id": "sys-001",
-                    "target_id": "sys-002",
-                    "weight": 0.7,
-                    "confidence": 0.9,
-                    "properties": {"context": "auth"},
-                },
-            ],
-        )
-        assert result["status"] == "ok"
-        rel = result["relationships"][0]["relationship"]
-        assert rel["weight"] == 0.7
-        assert rel["confidence"] == 0.9
-        assert rel["properties"]["context"] == "auth"
+        data = _read_graph_file(exported_graph)
+        rel_types = {r["relationship_type"] for r in data["relationships"]}
+        assert {"works_in", "depends_on"} <= rel_types
 
     def test_no_graph_loaded(self):
         result = _call_tool(
             "add_relationships_batch",
-            relationships=[
-                {"relationship_type": "works_in", "source_id": "per-001", "target_id": "dept-001"},
-            ],
+            relationships=[_WORKS_IN],
         )
         assert "error" in result
         assert "No graph loaded" in result["error"]
 
-    def test_multiple_validation_errors(self, tmp_path):
-        _build_test_kg(tmp_path)
+    def test_multiple_validation_errors(self, loaded_graph):
         result = _call_tool(
             "add_relationships_batch",
             relationships=[
-                {
-                    "relationship_type": "not_a_real_type",
-                    "source_id": "per-001",
-                    "target_id": "dept-001",
-                },
-                {
-                    "relationship_type": "works_in",
-                    "source_id": "per-999",
-                    "target_id": "dept-001",
-                },
+                {**_WORKS_IN, "relationship_type": "not_a_real_type"},
+                {**_WORKS_IN, "source_id": "per-999"},
             ],
         )
         assert result["status"] == "error"
@@ -372,47 +300,33 @@ class TestAddRelationshipsBatch:
 
 
 class TestRemoveRelationshipTool:
-    def test_remove_valid(self, tmp_path):
-        _build_test_kg(tmp_path)
+    def test_remove_valid(self, loaded_graph):
         # First add a relationship
-        add_result = _call_tool(
-            "add_relationship_tool",
-            relationship_type="works_in",
-            source_id="per-001",
-            target_id="dept-001",
-        )
+        add_result = _call_tool("add_relationship_tool", **_WORKS_IN)
         rel_id = add_result["relationship_id"]
-        count_after_add = state._kg.statistics["relationship_count"]
+        _, rels_after_add = _counts()
 
         # Now remove it
         result = _call_tool("remove_relationship_tool", relationship_id=rel_id)
         assert result["status"] == "ok"
         assert result["removed"]["relationship_type"] == "works_in"
-        assert state._kg.statistics["relationship_count"] == count_after_add - 1
+        assert _counts()[1] == rels_after_add - 1
 
-    def test_remove_not_found(self, tmp_path):
-        _build_test_kg(tmp_path)
+    def test_remove_not_found(self, loaded_graph):
         result = _call_tool("remove_relationship_tool", relationship_id="nonexistent-id")
         assert "error" in result
         assert "not found" in result["error"].lower()
 
-    def test_remove_persists_to_disk(self, tmp_path):
-        json_path = _build_test_kg(tmp_path)
+    def test_remove_persists_to_disk(self, exported_graph):
         # Add then remove
-        add_result = _call_tool(
-            "add_relationship_tool",
-            relationship_type="works_in",
-            source_id="per-001",
-            target_id="dept-001",
-        )
+        add_result = _call_tool("add_relationship_tool", **_WORKS_IN)
         rel_id = add_result["relationship_id"]
 
         _call_tool("remove_relationship_tool", relationship_id=rel_id)
 
         # Verify on disk
-        data = json.loads(Path(json_path).read_text())
-        rel_ids = [r.get("id", "") for r in data["relationships"]]
-        assert rel_id not in rel_ids
+        data = _read_graph_file(exported_graph)
+        assert all(r.get("id", "") != rel_id for r in data["relationships"])
 
     def test_remove_no_graph_loaded(self):
         result = _call_tool("remove_relationship_tool", relationship_id="some-id")
@@ -424,8 +338,7 @@ class TestRemoveRelationshipTool:
 
 
 class TestAddEntityTool:
-    def test_add_system(self, tmp_path):
-        _build_test_kg(tmp_path)
+    def test_add_system(self, loaded_graph):
         result = _call_tool(
             "add_entity_tool",
             entity_type="system",
@@ -437,8 +350,7 @@ class TestAddEntityTool:
         assert result["entity"]["name"] == "New API Gateway"
         assert result["entity"]["entity_type"] == "system"
 
-    def test_add_person(self, tmp_path):
-        _build_test_kg(tmp_path)
+    def test_add_person(self, loaded_graph):
         result = _call_tool(
             "add_entity_tool",
             entity_type="person",
@@ -452,8 +364,7 @@ class TestAddEntityTool:
         assert result["status"] == "ok"
         assert result["entity"]["name"] == "Bob Jones"
 
-    def test_add_department(self, tmp_path):
-        _build_test_kg(tmp_path)
+    def test_add_department(self, loaded_graph):
         result = _call_tool(
             "add_entity_tool",
             entity_type="department",
@@ -462,8 +373,7 @@ class TestAddEntityTool:
         assert result["status"] == "ok"
         assert result["entity"]["entity_type"] == "department"
 
-    def test_invalid_entity_type(self, tmp_path):
-        _build_test_kg(tmp_path)
+    def test_invalid_entity_type(self, loaded_graph):
         result = _call_tool(
             "add_entity_tool",
             entity_type="spaceship",
@@ -472,8 +382,7 @@ class TestAddEntityTool:
         assert "error" in result
         assert "Unknown entity_type" in result["error"]
 
-    def test_empty_name(self, tmp_path):
-        _build_test_kg(tmp_path)
+    def test_empty_name(self, loaded_graph):
         result = _call_tool(
             "add_entity_tool",
             entity_type="system",
@@ -482,27 +391,23 @@ class TestAddEntityTool:
         assert "error" in result
         assert "name" in result["error"].lower()
 
-    def test_entity_count_increases(self, tmp_path):
-        _build_test_kg(tmp_path)
-        before = state._kg.statistics["entity_count"]
+    def test_entity_count_increases(self, loaded_graph):
+        before, _ = _counts()
         _call_tool(
             "add_entity_tool",
             entity_type="system",
             name="Test System",
         )
-        after = state._kg.statistics["entity_count"]
-        assert after == before + 1
+        assert _counts()[0] == before + 1
 
-    def test_persists_to_disk(self, tmp_path):
-        json_path = _build_test_kg(tmp_path)
+    def test_persists_to_disk(self, exported_graph):
         _call_tool(
             "add_entity_tool",
             entity_type="system",
             name="Persisted System",
         )
-        data = json.loads(Path(json_path).read_text())
-        names = [e["name"] for e in data["entities"]]
-        assert "Persisted System" in names
+        data = _read_graph_file(exported_graph)
+        assert any(e["name"] == "Persisted System" for e in data["entities"])
 
     def test_no_graph_loaded(self):
         result = _call_tool(
@@ -518,8 +423,7 @@ class TestAddEntityTool:
 
 
 class TestUpdateEntityTool:
-    def test_update_name(self, tmp_path):
-        _build_test_kg(tmp_path)
+    def test_update_name(self, loaded_graph):
         result = _call_tool(
             "update_entity_tool",
             entity_id="sys-001",
@@ -528,8 +432,7 @@ class TestUpdateEntityTool:
         assert result["status"] == "ok"
         assert result["entity"]["name"] == "Auth Service v2"
 
-    def test_update_description(self, tmp_path):
-        _build_test_kg(tmp_path)
+    def test_update_description(self, loaded_graph):
         result = _call_tool(
             "update_entity_tool",
             entity_id="dept-001",
@@ -537,8 +440,7 @@ class TestUpdateEntityTool:
         )
         assert result["status"] == "ok"
 
-    def test_update_not_found(self, tmp_path):
-        _build_test_kg(tmp_path)
+    def test_update_not_found(self, loaded_graph):
         result = _call_tool(
             "update_entity_tool",
             entity_id="nonexistent-id",
@@ -547,8 +449,7 @@ class TestUpdateEntityTool:
         assert "error" in result
         assert "not found" in result["error"].lower()
 
-    def test_empty_updates(self, tmp_path):
-        _build_test_kg(tmp_path)
+    def test_empty_updates(self, loaded_graph):
         result = _call_tool(
             "update_entity_tool",
             entity_id="sys-001",
@@ -557,16 +458,14 @@ class TestUpdateEntityTool:
         assert "error" in result
         assert "No updates" in result["error"]
 
-    def test_persists_to_disk(self, tmp_path):
-        json_path = _build_test_kg(tmp_path)
+    def test_persists_to_disk(self, exported_graph):
         _call_tool(
             "update_entity_tool",
             entity_id="sys-001",
             updates={"name": "Updated Auth"},
         )
-        data = json.loads(Path(json_path).read_text())
-        names = [e["name"] for e in data["entities"]]
-        assert "Updated Auth" in names
+        data = _read_graph_file(exported_graph)
+        assert any(e["name"] == "Updated Auth" for e in data["entities"])
 
     def test_no_graph_loaded(self):
         result = _call_tool(
@@ -582,19 +481,17 @@ class TestUpdateEntityTool:
 
 
 class TestRemoveEntityTool:
-    def test_remove_valid(self, tmp_path):
-        _build_test_kg(tmp_path)
-        before = state._kg.statistics["entity_count"]
+    def test_remove_valid(self, loaded_graph):
+        before, _ = _counts()
         result = _call_tool(
             "remove_entity_tool",
             entity_id="sys-002",
         )
         assert result["status"] == "ok"
         assert result["removed"]["name"] == "DB Service"
-        assert state._kg.statistics["entity_count"] == before - 1
+        assert _counts()[0] == before - 1
 
-    def test_remove_not_found(self, tmp_path):
-        _build_test_kg(tmp_path)
+    def test_remove_not_found(self, loaded_graph):
         result = _call_tool(
             "remove_entity_tool",
             entity_id="nonexistent",
@@ -602,27 +499,20 @@ class TestRemoveEntityTool:
         assert "error" in result
         assert "not found" in result["error"].lower()
 
-    def test_remove_cascades_relationships(self, tmp_path):
-        _build_test_kg(tmp_path)
+    def test_remove_cascades_relationships(self, loaded_graph):
         # Add a relationship to sys-002
-        _call_tool(
-            "add_relationship_tool",
-            relationship_type="depends_on",
-            source_id="sys-001",
-            target_id="sys-002",
-        )
-        rel_count_before = state._kg.statistics["relationship_count"]
+        _call_tool("add_relationship_tool", **_DEPENDS_ON)
+        entities_before, rels_before = _counts()
         # Remove sys-002 — should also remove the relationship
         _call_tool("remove_entity_tool", entity_id="sys-002")
-        rel_count_after = state._kg.statistics["relationship_count"]
-        assert rel_count_after < rel_count_before
+        entities_after, rels_after = _counts()
+        assert entities_after == entities_before - 1
+        assert rels_after < rels_before
 
-    def test_remove_persists_to_disk(self, tmp_path):
-        json_path = _build_test_kg(tmp_path)
+    def test_remove_persists_to_disk(self, exported_graph):
         _call_tool("remove_entity_tool", entity_id="sys-002")
-        data = json.loads(Path(json_path).read_text())
-        ids = [e["id"] for e in data["entities"]]
-        assert "sys-002" not in ids
+        data = _read_graph_file(exported_graph)
+        assert all(e["id"] != "sys-002" for e in data["entities"])
 
     def test_no_graph_loaded(self):
         result = _call_tool(
@@ -2,17 +2,29 @@
 
 from __future__ import annotations
 
+import pytest
+
 from rag.context_builder import ContextBuilder
 
 
+@pytest.fixture(scope="module")
+def entities(populated_kg):
+    """All entities of the shared graph, listed once per module."""
+    return populated_kg.list_entities()
+
+
+@pytest.fixture(scope="module")
+def relationships(populated_kg):
+    """All relationships of the shared graph, listed once per module."""
+    return populated_kg.list_relationships()
+
+
 class TestBuildContext:
     """Tests for ContextBuilder.build_context."""
 
-    def test_build_context_includes_entity_details(self, populated_kg):
+    def test_build_context_includes_entity_details(self, populated_kg, entities):
         """Context should include entity names, types, and key attributes."""
-        entities = populated_kg.list_entities()
-        relationships = []
-        context = ContextBuilder.build_context(entities, relationships, populated_kg)
+        context = ContextBuilder.build_context(entities, [], populated_kg)
 
         # Should contain the header
         assert "Knowledge Graph Context" in context
@@ -28,14 +40,8 @@ class TestBuildContext:
         assert "DEPARTMENT" in context
         assert "SYSTEM" in context
 
-    def test_build_context_includes_relationships(self, populated_kg):
+    def test_build_context_includes_relationships(self, populated_kg, entities, relationships):
         """Context should include relationship descriptions in natural language."""
-        entities = populated_kg.list_entities()
-        # Get all relationships in the KG
-        relationships = []
-        for entity in entities:
-            rels = populated_kg.get_relationships(entity.id, direction="out")
-            relationships.extend(rels)
 
         context = ContextBuilder.build_context(entities, relationships, populated_kg)
 
@@ -44,13 +50,8 @@ class TestBuildContext:
         assert "Alice Smith" in context
         assert "Engineering" in context
 
-    def test_build_context_respects_token_budget(self, populated_kg):
+    def test_build_context_respects_token_budget(self, populated_kg, entities, relationships):
         """Context should be truncated if it exceeds the token budget."""
-        entities = populated_kg.list_entities()
-        relationships = []
-        for entity in entities:
-            rels = populated_kg.get_relationships(entity.id, direction="out")
-            relationships.extend(rels)
 
         # Use a very small token budget
         context = ContextBuilder.build_context(entities, relationships, populated_kg, max_tokens=50)
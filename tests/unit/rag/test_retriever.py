@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from domain.base import BaseRelationship, RelationshipType
 from domain.entities.department import Department
 from domain.entities.person import Person
@@ -9,8 +11,12 @@ from graph.knowledge_graph import KnowledgeGraph
 from rag.retriever import GraphRAGRetriever
 
 
-def _build_rich_kg() -> KnowledgeGraph:
-    """Build a KG with multiple interconnected entities for retrieval tests."""
+@pytest.fixture(scope="module")
+def rich_kg() -> KnowledgeGraph:
+    """Build a KG with multiple interconnected entities for retrieval tests.
+
+    Retrieval only reads the graph, so the module shares one instance.
+    """
     kg = KnowledgeGraph(backend="networkx", track_events=False)
 
     people = [
@@ -75,24 +81,26 @@ def _build_rich_kg() -> KnowledgeGraph:
     return kg
 
 
+@pytest.fixture(scope="module")
+def retriever() -> GraphRAGRetriever:
+    """A default retriever; it holds only configuration, so it is shared."""
+    return GraphRAGRetriever()
+
+
 class TestRetrieve:
     """Tests for GraphRAGRetriever.retrieve."""
 
-    def test_retrieve_finds_relevant_entities(self):
+    def test_retrieve_finds_relevant_entities(self, rich_kg, retriever):
         """Retrieve should find entities matching keywords in the question."""
-        kg = _build_rich_kg()
-        retriever = GraphRAGRetriever()
-        result = retriever.retrieve("Tell me about Alice Smith", kg)
+        result = retriever.retrieve("Tell me about Alice Smith", rich_kg)
 
         entity_names = [e.name for e in result.entities]
         assert "Alice Smith" in entity_names
         assert result.stats["entities_returned"] >= 1
 
-    def test_retrieve_expands_neighbors(self):
+    def test_retrieve_expands_neighbors(self, rich_kg, retriever):
         """Retrieve should include neighbor entities of matched entities."""
-        kg = _build_rich_kg()
-        retriever = GraphRAGRetriever()
-        result = retriever.retrieve("Alice Smith", kg)
+        result = retriever.retrieve("Alice Smith", rich_kg)
 
         entity_names = [e.name for e in result.entities]
         # Alice's neighbors: Engineering (works_in) and Bob (manages)
@@ -100,30 +108,24 @@ class TestRetrieve:
         # At least one neighbor should be included
         assert len(result.entities) > 1
 
-    def test_retrieve_returns_context_string(self):
+    def test_retrieve_returns_context_string(self, rich_kg, retriever):
         """Retrieve should return a non-empty formatted context string."""
-        kg = _build_rich_kg()
-        retriever = GraphRAGRetriever()
-        result = retriever.retrieve("Who works in Engineering?", kg)
+        result = retriever.retrieve("Who works in Engineering?", rich_kg)
 
         assert result.context
         assert "Knowledge Graph Context" in result.context
         assert len(result.context) > 50
 
-    def test_retrieve_respects_top_k(self):
+    def test_retrieve_respects_top_k(self, rich_kg, retriever):
         """Retrieve should not return more entities than top_k."""
-        kg = _build_rich_kg()
-        retriever = GraphRAGRetriever()
-        result = retriever.retrieve("Tell me about everyone", kg, top_k=2)
+        result = retriever.retrieve("Tell me about everyone", rich_kg, top_k=2)
 
         assert len(result.entities) <= 2
         assert result.stats["entities_returned"] <= 2
 
-    def test_retrieve_handles_no_matches(self):
+    def test_retrieve_handles_no_matches(self, rich_kg, retriever):
         """Retrieve should return empty results for a completely unrelated question."""
-        kg = _build_rich_kg()
-        retriever = GraphRAGRetriever()
-        result = retriever.retrieve("zzzzxxxxxqqqq yyyyywwwww", kg)
+        result = retriever.retrieve("zzzzxxxxxqqqq yyyyywwwww", rich_kg)
 
         assert len(result.entities) == 0
         assert len(result.relationships) == 0
@@ -2,10 +2,6 @@
 
 from __future__ import annotations
 
-import json
-import tempfile
-from pathlib import Path
-
 import pytest
 
 flask = pytest.importorskip("flask", reason="flask not installed")
@@ -23,20 +19,39 @@ def _reset_serve_state():
     serve_module._kg = None
 
 
+@pytest.fixture(scope="session")
+def graph_file(populated_kg, tmp_path_factory):
+    """Export the populated_kg fixture to a JSON file once per session."""
+    path = tmp_path_factory.mktemp("serve") / "test_graph.json"
+    JSONExporter().export(populated_kg.engine, path)
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def app():
+    """Create the Flask app once per module, with no graph loaded.
+
+    Routes read the module-level ``_kg`` on every request, so one app serves
+    both loaded and blank clients: ``client`` installs ``populated_kg`` for
+    the duration of a test, ``blank_client`` leaves ``_kg`` unset. The
+    ``create_app(kg=...)`` path itself is covered in ``TestLoadEndpoint``.
+    """
+    app = create_app()
+    app.config["TESTING"] = True
+    return app
+
+
 @pytest.fixture()
-def graph_file(populated_kg):
-    """Export the populated_kg fixture to a temp JSON file."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        path = Path(tmpdir) / "test_graph.json"
-        JSONExporter().export(populated_kg.engine, path)
-        yield str(path)
+def client(app, populated_kg, monkeypatch):
+    """Create a Flask test client with the shared populated_kg installed as ``_kg``."""
+    monkeypatch.setattr(serve_module, "_kg", populated_kg)
+    with app.test_client() as c:
+        yield c
 
 
 @pytest.fixture()
-def client(graph_file):
-    """Create a Flask test client with a loaded graph."""
-    app = create_app(graph_path=graph_file)
-    app.config["TESTING"] = True
+def blank_client(app):
+    """Create a Flask test client with no graph loaded."""
     with app.test_client() as c:
         yield c
 
@@ -44,14 +59,14 @@ def client(graph_file):
 class TestHealthAndIndex:
     def test_index_returns_endpoints(self, client):
         resp = client.get("/")
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert resp.status_code == 200
         assert data["service"] == "hc-enterprise-kg"
         assert "endpoints" in data
 
     def test_health_shows_graph_loaded(self, client):
         resp = client.get("/health")
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert data["status"] == "ok"
         assert data["graph_loaded"] is True
         assert data["entity_count"] > 0
@@ -60,43 +75,40 @@ class TestHealthAndIndex:
 class TestStatistics:
     def test_statistics_returns_counts(self, client):
         resp = client.get("/statistics")
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert resp.status_code == 200
         assert "entity_count" in data
         assert "relationship_count" in data
 
-    def test_statistics_without_graph(self):
-        app = create_app()
-        app.config["TESTING"] = True
-        with app.test_client() as c:
-            resp = c.get("/statistics")
-            assert resp.status_code == 409
+    def test_statistics_without_graph(self, blank_client):
+        resp = blank_client.get("/statistics")
+        assert resp.status_code == 409
 
 
 class TestEntities:
     def test_list_all_entities(self, client):
         resp = client.get("/entities")
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert resp.status_code == 200
         assert isinstance(data, list)
         assert len(data) >= 3  # person, dept, system
 
     def test_list_filtered_by_type(self, client):
         resp = client.get("/entities?type=person")
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert resp.status_code == 200
         assert all(e["entity_type"] == "person" for e in data)
 
     def test_list_with_limit(self, client):
         resp = client.get("/entities?limit=1")
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert len(data) == 1
 
     def test_get_entity_by_id(self, client):
-        entities = json.loads(client.get("/entities").data)
+        entities = client.get("/entities").get_json()
         eid = entities[0]["id"]
         resp = client.get(f"/entities/{eid}")
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert resp.status_code == 200
         assert data["id"] == eid
 
@@ -106,14 +118,14 @@ class TestEntities:
 
     def test_invalid_entity_type(self, client):
         resp = client.get("/entities?type=bogus")
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert any("error" in item for item in data)
 
 
 class TestNeighbors:
     def test_get_neighbors(self, client):
         resp = client.get("/entities/person-1/neighbors")
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert resp.status_code == 200
         assert isinstance(data, list)
         assert len(data) >= 1
@@ -126,7 +138,7 @@ class TestNeighbors:
 class TestPaths:
     def test_shortest_path(self, client):
         resp = client.get("/path/person-1/sys-1")
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert resp.status_code == 200
         assert "path" in data
         assert data["path_length"] >= 1
@@ -139,7 +151,7 @@ class TestPaths:
 class TestBlastRadius:
     def test_blast_radius(self, client):
         resp = client.get("/blast-radius/person-1")
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert resp.status_code == 200
         assert "total_affected" in data
         assert data["total_affected"] >= 1
@@ -152,7 +164,7 @@ class TestBlastRadius:
 class TestCentrality:
     def test_degree_centrality(self, client):
         resp = client.get("/centrality")
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert resp.status_code == 200
         assert isinstance(data, list)
         assert len(data) >= 1
@@ -160,20 +172,20 @@ class TestCentrality:
 
     def test_betweenness(self, client):
         resp = client.get("/centrality?metric=betweenness")
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert resp.status_code == 200
         assert isinstance(data, list)
 
     def test_invalid_metric(self, client):
         resp = client.get("/centrality?metric=bogus")
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert any("error" in item for item in data)
 
 
 class TestSearch:
     def test_fuzzy_search(self, client):
         resp = client.get("/search?q=alice")
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert resp.status_code == 200
         assert isinstance(data, list)
         assert len(data) >= 1
@@ -187,7 +199,7 @@ class TestSearch:
 class TestAsk:
     def test_ask_returns_context(self, client):
         resp = client.post("/ask", json={"question": "Who works in Engineering?"})
-        data = json.loads(resp.data)
+        data = resp.get_json()
         assert resp.status_code == 200
         assert "context" in data
         assert "entities" in data
@@ -197,10 +209,19 @@ class TestAsk:
         assert resp.status_code == 400
 
 
+# (tool name, arguments, key expected in the result or None)
+_OPENAI_CALL_CASES = [
+    pytest.param("get_statistics", {}, "entity_count", id="get_statistics"),
+    pytest.param("search_entities", {"query": "alice"}, None, id="search_entities"),
+    pytest.param("ask_graph", {"question": "What systems exist?"}, "context", id="ask_graph"),
+]
+
+
 class TestOpenAIEndpoints:
-    def test_openai_tools_returns_definitions(self, client):
-        resp = client.get("/openai/tools")
-        data = json.loads(resp.data)
+    def test_openai_tools_returns_definitions(self, blank_client):
+        # The tool list is static, so no graph needs to be loaded
+        resp = blank_client.get("/openai/tools")
+        data = resp.get_json()
         assert resp.status_code == 200
         assert isinstance(data, list)
         assert len(data) >= 8
@@ -210,43 +231,14 @@ class TestOpenAIEndpoints:
             assert "description" in tool["function"]
             assert "parameters" in tool["function"]
 
-    def test_openai_call_get_statistics(self, client):
-        resp = client.post(
-            "/openai/call",
-            json={
-                "name": "get_statistics",
-                "arguments": {},
-            },
-        )
-        data = json.loads(resp.data)
+    @pytest.mark.parametrize("name, arguments, expect_key", _OPENAI_CALL_CASES)
+    def test_openai_call(self, client, name, arguments, expect_key):
+        resp = client.post("/openai/call", json={"name": name, "arguments": arguments})
+        data = resp.get_json()
         assert resp.status_code == 200
         assert "result" in data
-        assert "entity_count" in data["result"]
-
-    def test_openai_call_search(self, client):
-        resp = client.post(
-            "/openai/call",
-            json={
-                "name": "search_entities",
-                "arguments": {"query": "alice"},
-            },
-        )
-        data = json.loads(resp.data)
-        assert resp.status_code == 200
-        assert "result" in data
-
-    def test_openai_call_ask_graph(self, client):
-        resp = client.post(
-            "/openai/call",
-            json={
-                "name": "ask_graph",
-                "arguments": {"question": "What systems exist?"},
-            },
-        )
-        data = json.loads(resp.data)
-        assert resp.status_code == 200
-        assert "result" in data
-        assert "context" in data["result"]
+        if expect_key is not None:
+            assert expect_key in data["result"]
 
     def test_openai_call_unknown_tool(self, client):
         resp = client.post(
@@ -260,32 +252,36 @@ class TestOpenAIEndpoints:
 
 
 class TestLoadEndpoint:
-    def test_load_graph_via_api(self, graph_file):
-        app = create_app()
-        app.config["TESTING"] = True
-        with app.test_client() as c:
-            # No graph yet (state was reset by autouse fixture)
-            resp = c.get("/health")
-            data = json.loads(resp.data)
-            assert data["graph_loaded"] is False
-
-            # Load via POST
-            resp = c.post("/load", json={"path": graph_file})
-            data = json.loads(resp.data)
-            assert resp.status_code == 200
-            assert data["status"] == "ok"
-
-            # Now graph is loaded
-            resp = c.get("/health")
-            data = json.loads(resp.data)
-            assert data["graph_loaded"] is True
-
-    def test_load_missing_path(self):
-        app = create_app()
-        app.config["TESTING"] = True
-        with app.test_client() as c:
-            resp = c.post("/load", json={})
-            assert resp.status_code == 400
+    def test_load_graph_via_api(self, blank_client, graph_file):
+        # No graph yet (state was reset by autouse fixture)
+        resp = blank_client.get("/health")
+        data = resp.get_json()
+        assert data["graph_loaded"] is False
+
+        # Load via POST
+        resp = blank_client.post("/load", json={"path": graph_file})
+        data = resp.get_json()
+        assert resp.status_code == 200
+        assert data["status"] == "ok"
+
+        # Now graph is loaded
+        resp = blank_client.get("/health")
+        data = resp.get_json()
+        assert data["graph_loaded"] is True
+
+    def test_load_missing_path(self, blank_client):
+        resp = blank_client.post("/load", json={})
+        assert resp.status_code == 400
+
+    def test_create_app_loads_graph_path(self, graph_file, populated_kg):
+        create_app(graph_path=graph_file)
+        assert (
+            serve_module._kg.statistics["entity_count"] == populated_kg.statistics["entity_count"]
+        )
+
+    def test_create_app_prefers_in_memory_graph(self, graph_file, populated_kg):
+        create_app(graph_path=graph_file, kg=populated_kg)
+        assert serve_module._kg is populated_kg
 
 
 class TestOpenAIToolsCompleteness:
@@ -0,0 +1,52 @@
+"""Shared fixtures for synthetic generation tests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from synthetic.profiles.tech_company import mid_size_tech_company
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from graph.knowledge_graph import KnowledgeGraph
+    from synthetic.orchestrator import SyntheticOrchestrator
+    from synthetic.profiles.base_profile import OrgProfile
+
+
+@pytest.fixture(scope="session")
+def profile_factory() -> Callable[[int], OrgProfile]:
+    """Return ``mid_size_tech_company`` memoised by employee count.
+
+    Generators and the orchestrator only read the profile, so one instance
+    per size is shared across the session.
+    """
+    cache: dict[int, OrgProfile] = {}
+
+    def make(employee_count: int) -> OrgProfile:
+        if employee_count not in cache:
+            cache[employee_count] = mid_size_tech_company(employee_count)
+        return cache[employee_count]
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def generated_graph(
+    profile_factory: Callable[[int], OrgProfile],
+) -> tuple[KnowledgeGraph, SyntheticOrchestrator]:
+    """Generate one seeded 30-employee graph for the session.
+
+    30 employees is enough for every ratio and per-type check that uses it.
+    Shared by every test that requests it, so tests must only read from the
+    graph and the orchestrator's context.
+    """
+    from graph.knowledge_graph import KnowledgeGraph
+    from synthetic.orchestrator import SyntheticOrchestrator
+
+    kg = KnowledgeGraph(track_events=False)
+    orch = SyntheticOrchestrator(kg, profile_factory(30), seed=42)
+    orch.generate()
+    return kg, orch
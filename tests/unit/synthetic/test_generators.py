@@ -1,69 +1,74 @@
 """Tests for entity generators."""
 
+import pytest
+
 # Import to trigger registration
 import synthetic.generators  # noqa: F401
 from domain.base import EntityType
 from synthetic.base import GenerationContext, GeneratorRegistry
-from synthetic.profiles.tech_company import mid_size_tech_company
+
+_EXPECTED_GENERATORS = frozenset(
+    {
+        EntityType.PERSON,
+        EntityType.DEPARTMENT,
+        EntityType.ROLE,
+        EntityType.SYSTEM,
+        EntityType.NETWORK,
+        EntityType.DATA_ASSET,
+        EntityType.POLICY,
+        EntityType.VENDOR,
+        EntityType.LOCATION,
+        EntityType.VULNERABILITY,
+        EntityType.THREAT_ACTOR,
+        EntityType.INCIDENT,
+    }
+)
+
+
+@pytest.fixture(scope="module")
+def generators():
+    """One instance of every registered generator; generators hold no state."""
+    return {entity_type: cls() for entity_type, cls in GeneratorRegistry.all().items()}
 
 
 class TestGenerators:
-    def _make_context(self, employees=50):
-        profile = mid_size_tech_company(employees)
-        return GenerationContext(profile=profile, seed=42)
+    @pytest.fixture()
+    def ctx(self, profile_factory):
+        return GenerationContext(profile=profile_factory(50), seed=42)
 
-    def test_people_generator(self):
-        ctx = self._make_context()
-        gen = GeneratorRegistry.get(EntityType.PERSON)()
+    def test_people_generator(self, ctx, generators):
+        gen = generators[EntityType.PERSON]
         people = gen.generate(50, ctx)
         assert len(people) == 50
-        assert all(p.entity_type == EntityType.PERSON for p in people)
+        assert {p.entity_type for p in people} == {EntityType.PERSON}
         assert all(p.email for p in people)
 
-    def test_department_generator(self):
-        ctx = self._make_context()
-        gen = GeneratorRegistry.get(EntityType.DEPARTMENT)()
+    def test_department_generator(self, ctx, generators):
+        gen = generators[EntityType.DEPARTMENT]
         depts = gen.generate(len(ctx.profile.department_specs), ctx)
         assert len(depts) == len(ctx.profile.department_specs)
 
-    def test_system_generator(self):
-        ctx = self._make_context()
-        gen = GeneratorRegistry.get(EntityType.SYSTEM)()
+    def test_system_generator(self, ctx, generators):
+        gen = generators[EntityType.SYSTEM]
         systems = gen.generate(20, ctx)
         assert len(systems) == 20
-        assert all(s.entity_type == EntityType.SYSTEM for s in systems)
+        assert {s.entity_type for s in systems} == {EntityType.SYSTEM}
 
-    def test_vulnerability_generator(self):
-        ctx = self._make_context()
-        gen = GeneratorRegistry.get(EntityType.VULNERABILITY)()
+    def test_vulnerability_generator(self, ctx, generators):
+        gen = generators[EntityType.VULNERABILITY]
         vulns = gen.generate(5, ctx)
         assert len(vulns) == 5
         assert all(v.cve_id for v in vulns)
 
-    def test_seed_reproducibility(self):
+    def test_seed_reproducibility(self, profile_factory):
         # Each context re-seeds Faker globally, so we need fresh generators
-        ctx1 = GenerationContext(profile=mid_size_tech_company(50), seed=42)
+        ctx1 = GenerationContext(profile=profile_factory(50), seed=42)
         people1 = GeneratorRegistry.get(EntityType.PERSON)().generate(10, ctx1)
 
-        ctx2 = GenerationContext(profile=mid_size_tech_company(50), seed=42)
+        ctx2 = GenerationContext(profile=profile_factory(50), seed=42)
         people2 = GeneratorRegistry.get(EntityType.PERSON)().generate(10, ctx2)
 
         assert [p.name for p in people1] == [p.name for p in people2]
 
     def test_all_generators_registered(self):
-        expected = {
-            EntityType.PERSON,
-            EntityType.DEPARTMENT,
-            EntityType.ROLE,
-            EntityType.SYSTEM,
-            EntityType.NETWORK,
-            EntityType.DATA_ASSET,
-            EntityType.POLICY,
-            EntityType.VENDOR,
-            EntityType.LOCATION,
-            EntityType.VULNERABILITY,
-            EntityType.THREAT_ACTOR,
-            EntityType.INCIDENT,
-        }
-        registered = set(GeneratorRegistry.all().keys())
-        assert expected.issubset(registered)
+        assert _EXPECTED_GENERATORS.issubset(GeneratorRegistry.all().keys())
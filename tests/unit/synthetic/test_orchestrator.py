@@ -1,16 +1,22 @@
 """Tests for SyntheticOrchestrator."""
 
+import pytest
+
 from graph.knowledge_graph import KnowledgeGraph
 from synthetic.orchestrator import SyntheticOrchestrator
-from synthetic.profiles.tech_company import mid_size_tech_company
+
+
+@pytest.fixture(scope="module")
+def small_org(profile_factory):
+    """Generate the default 50-employee org once; returns (kg, counts)."""
+    kg = KnowledgeGraph(track_events=False)
+    counts = SyntheticOrchestrator(kg, profile_factory(50), seed=42).generate()
+    return kg, counts
 
 
 class TestSyntheticOrchestrator:
-    def test_generate_small_org(self):
-        kg = KnowledgeGraph()
-        profile = mid_size_tech_company(50)
-        orchestrator = SyntheticOrchestrator(kg, profile, seed=42)
-        counts = orchestrator.generate()
+    def test_generate_small_org(self, small_org):
+        kg, counts = small_org
 
         assert counts["person"] == 50
         assert counts["department"] == 10
@@ -18,10 +24,10 @@ class TestSyntheticOrchestrator:
         assert kg.statistics["entity_count"] > 50
         assert kg.statistics["relationship_count"] > 0
 
-    def test_generate_with_seed_reproducible(self):
-        kg1 = KnowledgeGraph()
-        kg2 = KnowledgeGraph()
-        profile = mid_size_tech_company(20)
+    def test_generate_with_seed_reproducible(self, profile_factory):
+        kg1 = KnowledgeGraph(track_events=False)
+        kg2 = KnowledgeGraph(track_events=False)
+        profile = profile_factory(20)
 
         SyntheticOrchestrator(kg1, profile, seed=42).generate()
         SyntheticOrchestrator(kg2, profile, seed=42).generate()
@@ -29,10 +35,10 @@ class TestSyntheticOrchestrator:
         assert kg1.statistics["entity_count"] == kg2.statistics["entity_count"]
         assert kg1.statistics["relationship_count"] == kg2.statistics["relationship_count"]
 
-    def test_roles_generated(self):
+    def test_roles_generated(self, profile_factory):
         """RoleGenerator runs and produces Role entities for each department."""
-        kg = KnowledgeGraph()
-        profile = mid_size_tech_company(20)
+        kg = KnowledgeGraph(track_events=False)
+        profile = profile_factory(20)
         counts = SyntheticOrchestrator(kg, profile, seed=42).generate()
 
         assert "role" in counts
@@ -40,17 +46,17 @@ class TestSyntheticOrchestrator:
         # Should have at least one role per department
         assert counts["role"] >= counts["department"]
 
-    def test_event_log_populated(self):
+    def test_event_log_populated(self, profile_factory):
         kg = KnowledgeGraph(track_events=True)
-        profile = mid_size_tech_company(10)
+        profile = profile_factory(10)
         SyntheticOrchestrator(kg, profile, seed=42).generate()
 
         assert len(kg.event_log) > 0
 
-    def test_count_overrides_apply(self):
+    def test_count_overrides_apply(self, profile_factory):
         """Entity count overrides should produce exact counts."""
-        kg = KnowledgeGraph()
-        profile = mid_size_tech_company(500)
+        kg = KnowledgeGraph(track_events=False)
+        profile = profile_factory(500)
         overrides = {"system": 25, "vendor": 5, "control": 3}
         counts = SyntheticOrchestrator(kg, profile, seed=42, count_overrides=overrides).generate()
 
@@ -62,24 +68,20 @@ class TestSyntheticOrchestrator:
         assert counts["department"] > 0
         assert counts["risk"] > 0
 
-    def test_count_overrides_empty_dict_is_noop(self):
+    def test_count_overrides_empty_dict_is_noop(self, profile_factory, small_org):
         """Empty overrides dict should not change behavior."""
-        kg1 = KnowledgeGraph()
-        kg2 = KnowledgeGraph()
-        profile = mid_size_tech_company(50)
-
-        counts_no_override = SyntheticOrchestrator(kg1, profile, seed=42).generate()
+        _, counts_no_override = small_org
         counts_empty_override = SyntheticOrchestrator(
-            kg2, profile, seed=42, count_overrides={}
+            KnowledgeGraph(track_events=False), profile_factory(50), seed=42, count_overrides={}
         ).generate()
 
         assert counts_no_override["system"] == counts_empty_override["system"]
         assert counts_no_override["vendor"] == counts_empty_override["vendor"]
 
-    def test_count_overrides_zero_suppresses_entity(self):
+    def test_count_overrides_zero_suppresses_entity(self, profile_factory):
         """Override of 0 should suppress generation of that entity type."""
-        kg = KnowledgeGraph()
-        profile = mid_size_tech_company(50)
+        kg = KnowledgeGraph(track_events=False)
+        profile = profile_factory(50)
         overrides = {"threat_actor": 0}
         counts = SyntheticOrchestrator(kg, profile, seed=42, count_overrides=overrides).generate()
 
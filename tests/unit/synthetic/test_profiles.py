@@ -1,30 +1,30 @@
 """Tests for organization profiles."""
 
+import math
+
+import pytest
+
 from synthetic.profiles.financial_org import financial_org
 from synthetic.profiles.healthcare_org import healthcare_org
 from synthetic.profiles.tech_company import mid_size_tech_company
 
+# (profile factory, employee count, industry, department count)
+_PROFILE_CASES = [
+    pytest.param(mid_size_tech_company, 500, "technology", 10, id="tech"),
+    pytest.param(healthcare_org, 2000, "healthcare", 10, id="healthcare"),
+    pytest.param(financial_org, 1000, "financial_services", 11, id="financial"),
+]
+
 
 class TestProfiles:
-    def test_tech_profile(self):
-        profile = mid_size_tech_company(500)
-        assert profile.employee_count == 500
-        assert profile.industry == "technology"
-        assert len(profile.department_specs) == 10
+    @pytest.mark.parametrize("factory, employees, industry, departments", _PROFILE_CASES)
+    def test_profile(self, factory, employees, industry, departments):
+        profile = factory(employees)
+        assert profile.employee_count == employees
+        assert profile.industry == industry
+        assert len(profile.department_specs) == departments
         fractions = sum(s.headcount_fraction for s in profile.department_specs)
-        assert 0.99 <= fractions <= 1.01
-
-    def test_healthcare_profile(self):
-        profile = healthcare_org(2000)
-        assert profile.employee_count == 2000
-        assert profile.industry == "healthcare"
-        assert len(profile.department_specs) == 10
-
-    def test_financial_profile(self):
-        profile = financial_org(1000)
-        assert profile.employee_count == 1000
-        assert profile.industry == "financial_services"
-        assert len(profile.department_specs) == 11
+        assert math.isclose(fractions, 1.0, abs_tol=0.01)
 
     def test_profile_custom_employee_count(self):
         profile = mid_size_tech_company(100)